@@ -44,6 +44,13 @@ from src.utils.health import is_safe_mode_active
 from src.strategies.unified_trading_system import run_unified_trading_system, TradingSystemConfig
 from beast_mode_dashboard import BeastModeDashboard
 
+# uvloop's libuv scheduler cuts per-task overhead for request fan-outs (Linux/macOS)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 class BeastModeBot:
     """
@@ -774,6 +781,8 @@ Beast Mode Features:
 
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -5,31 +5,576 @@ Handles authentication, market data, and trade execution.
 
 import asyncio
 import base64
-import hashlib
-import hmac
+import functools
 import json
+import logging
 import os
+import random
 import re
 from pathlib import Path
 import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
-from urllib.parse import urlencode
+from email.utils import parsedate_to_datetime
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import ed25519, padding
 
 from src.config.settings import settings
 from src.utils.logging_setup import TradingLoggerMixin
 from src.utils.health import record_failure
 
+# orjson is 3-10x faster than stdlib json on large market pages
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# HTTP/2 lets concurrent order bursts multiplex over one TLS connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a request body to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Endpoint paths; %-templates take a single substitution per call
+_ORDER_PATH = "/trade-api/v2/portfolio/orders/%s"
+_AMEND_ORDER_PATH = "/trade-api/v2/portfolio/orders/%s/amend"
+_DECREASE_ORDER_PATH = "/trade-api/v2/portfolio/orders/%s/decrease"
+_QUEUE_POSITION_PATH = "/trade-api/v2/portfolio/orders/%s/queue_position"
+_BATCHED_ORDERS_PATH = "/trade-api/v2/portfolio/orders/batched"
+_ORDER_GROUP_PATH = "/trade-api/v2/portfolio/order_groups/%s"
+_RESET_ORDER_GROUP_PATH = "/trade-api/v2/portfolio/order_groups/%s/reset"
+_INCENTIVE_PROGRAMS_PATH = "/trade-api/v2/incentive_programs"
+_FCM_ORDERS_PATH = "/trade-api/v2/fcm/orders"
+_FCM_POSITIONS_PATH = "/trade-api/v2/fcm/positions"
+_STRUCTURED_TARGETS_PATH = "/trade-api/v2/structured_targets"
+_STRUCTURED_TARGET_PATH = "/trade-api/v2/structured_targets/%s"
+_MILESTONES_PATH = "/trade-api/v2/milestones"
+_MILESTONE_PATH = "/trade-api/v2/milestones/%s"
+
+# How _send_request retries an error status (other 5xx count as "idempotent"):
+#   any        - rejected unprocessed, so every method may retry
+#   idempotent - may already have been applied, so only GETs retry
+#   resign     - retry once with a fresh timestamp and signature
+_RETRY_POLICY = {401: "resign", 429: "any"}
+
+# Order field defaults, looked up instead of branching per side/action
+_SIDE_PRICE_FIELD = {"yes": "yes_price", "no": "no_price"}
+_MARKET_ORDER_PRICE = {"buy": 99, "sell": 1}
+
+# stdlib logger behind the structlog proxy, for cheap level checks in hot paths
+_stdlib_logger = logging.getLogger("trading_system.kalshiclient")
+
+
+def _require_nonempty(**fields: Any) -> None:
+    """Raise ValueError naming the first empty field, if any."""
+    empty = next((name for name, value in fields.items() if not value), None)
+    if empty is not None:
+        raise ValueError(f"{empty} cannot be empty")
+
+
+def _ttl_cached(ttl: float, endpoint: str):
+    """
+    Memoize an argument-less async client method for ``ttl`` seconds.
+
+    The cache lives on the instance, keyed by the method's ``endpoint`` so
+    invalidate_cache(prefix) reaches it, and concurrent callers share one
+    in-flight request. Failed fetches are not cached.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self):
+            entry = self._ttl_cache.get(endpoint)
+            now = time.monotonic()
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            task = self._ttl_inflight.get(endpoint)
+            if task is None:
+                task = asyncio.ensure_future(fn(self))
+                self._ttl_inflight[endpoint] = task
+                task.add_done_callback(lambda _: self._ttl_inflight.pop(endpoint, None))
+
+            # Shield so one cancelled caller does not cancel the shared fetch
+            value = await asyncio.shield(task)
+            self._ttl_cache[endpoint] = (time.monotonic() + ttl, value)
+            return value
+        return wrapper
+    return decorator
+
+
+_item_value = itemgetter(1)
+
+
+def _query_params(**fields: Any) -> Dict[str, Any]:
+    """Query params from keyword fields, dropping unset (falsy) filters."""
+    # filter/itemgetter keep the whole scan in C
+    return dict(filter(_item_value, fields.items()))
+
+
+def _request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Tuple]:
+    """Hashable identity of a GET request (list values become tuples)."""
+    if not params:
+        return (endpoint, ())
+    return (endpoint, tuple(sorted(
+        (k, tuple(v) if isinstance(v, (list, tuple)) else v) for k, v in params.items()
+    )))
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_prefix(method: str, path: str) -> bytes:
+    """
+    Method + path portion of the signed message, as bytes.
+
+    Query parameters are stripped per the Kalshi Quick Start docs: for
+    /portfolio/orders?limit=5, sign only /trade-api/v2/portfolio/orders.
+    The client talks to a few dozen endpoints, so the cache stays small.
+    """
+    return (method.upper() + path.split('?')[0]).encode('utf-8')
+
+
+def _distance_to_mid(amendment: Dict[str, Any], mids: Dict[str, float]) -> float:
+    """Cents between an amendment's new price and its market's YES mid (inf if unknown)."""
+    mid = mids.get(amendment.get("ticker"))
+    if mid is None:
+        return float("inf")
+    if amendment.get("yes_price") is not None:
+        return abs(amendment["yes_price"] - mid)
+    if amendment.get("no_price") is not None:
+        return abs(100 - amendment["no_price"] - mid)
+    return float("inf")
+
+
+def _header_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After / X-RateLimit-Reset style header.
+
+    Accepts delta-seconds, epoch seconds or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    if seconds > 1e9:
+        # Absolute epoch timestamp rather than a delay
+        seconds -= time.time()
+    return max(0.0, seconds)
+
+
+def _is_offset_cursor(cursor: str, page_size: int) -> bool:
+    """Whether a cursor is a plain numeric offset equal to the first page size."""
+    return page_size > 0 and cursor.isdigit() and int(cursor) == page_size
+
+
+@dataclass(slots=True, frozen=True)
+class MarketSnapshot:
+    """Compact, read-only view of a market from the markets endpoints."""
+    ticker: str
+    event_ticker: str = ""
+    status: str = ""
+    yes_bid: int = 0
+    yes_ask: int = 0
+    no_bid: int = 0
+    no_ask: int = 0
+    last_price: int = 0
+    volume: int = 0
+    open_interest: int = 0
+    close_time: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "MarketSnapshot":
+        """Build a snapshot from a raw market dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            ticker=data["ticker"],
+            event_ticker=get("event_ticker") or "",
+            status=get("status") or "",
+            yes_bid=get("yes_bid") or 0,
+            yes_ask=get("yes_ask") or 0,
+            no_bid=get("no_bid") or 0,
+            no_ask=get("no_ask") or 0,
+            last_price=get("last_price") or 0,
+            volume=get("volume") or 0,
+            open_interest=get("open_interest") or 0,
+            close_time=get("close_time"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class StructuredTarget:
+    """Compact, read-only view of a structured target."""
+    id: str
+    name: str = ""
+    type: str = ""
+    details: Optional[Dict[str, Any]] = None
+    source_id: Optional[str] = None
+    last_updated_ts: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "StructuredTarget":
+        """Build from a raw structured target dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            id=data["id"],
+            name=get("name") or "",
+            type=get("type") or "",
+            details=get("details"),
+            source_id=get("source_id"),
+            last_updated_ts=get("last_updated_ts"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Milestone:
+    """Compact, read-only view of a milestone."""
+    id: str
+    category: str = ""
+    type: str = ""
+    title: str = ""
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    related_event_tickers: Tuple[str, ...] = ()
+    source_id: Optional[str] = None
+    last_updated_ts: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Milestone":
+        """Build from a raw milestone dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            id=data["id"],
+            category=get("category") or "",
+            type=get("type") or "",
+            title=get("title") or "",
+            start_date=get("start_date"),
+            end_date=get("end_date"),
+            related_event_tickers=tuple(get("related_event_tickers") or ()),
+            source_id=get("source_id"),
+            last_updated_ts=get("last_updated_ts"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class IncentiveProgram:
+    """Compact, read-only view of an incentive program."""
+    id: str
+    market_ticker: str = ""
+    incentive_type: str = ""
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    period_reward: int = 0
+    paid_out: bool = False
+    discount_factor_bps: Optional[int] = None
+    target_size: Optional[int] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "IncentiveProgram":
+        """Build from a raw incentive program dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            id=data["id"],
+            market_ticker=get("market_ticker") or "",
+            incentive_type=get("incentive_type") or "",
+            start_date=get("start_date"),
+            end_date=get("end_date"),
+            period_reward=get("period_reward") or 0,
+            paid_out=bool(get("paid_out")),
+            discount_factor_bps=get("discount_factor_bps"),
+            target_size=get("target_size"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class FcmOrder:
+    """Compact, read-only view of an order from the FCM orders endpoint."""
+    order_id: str
+    ticker: str = ""
+    client_order_id: str = ""
+    side: str = ""
+    action: str = ""
+    type: str = ""
+    status: str = ""
+    yes_price: int = 0
+    no_price: int = 0
+    fill_count: int = 0
+    remaining_count: int = 0
+    created_time: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "FcmOrder":
+        """Build from a raw order dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            order_id=data["order_id"],
+            ticker=get("ticker") or "",
+            client_order_id=get("client_order_id") or "",
+            side=get("side") or "",
+            action=get("action") or "",
+            type=get("type") or "",
+            status=get("status") or "",
+            yes_price=get("yes_price") or 0,
+            no_price=get("no_price") or 0,
+            fill_count=get("fill_count") or 0,
+            remaining_count=get("remaining_count") or 0,
+            created_time=get("created_time"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class FcmPosition:
+    """Compact, read-only view of a market position from the FCM positions endpoint."""
+    ticker: str
+    position: int = 0
+    market_exposure: int = 0
+    realized_pnl: int = 0
+    total_traded: int = 0
+    fees_paid: int = 0
+    resting_orders_count: int = 0
+    last_updated_ts: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "FcmPosition":
+        """Build from a raw market position dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            ticker=data["ticker"],
+            position=get("position") or 0,
+            market_exposure=get("market_exposure") or 0,
+            realized_pnl=get("realized_pnl") or 0,
+            total_traded=get("total_traded") or 0,
+            fees_paid=get("fees_paid") or 0,
+            resting_orders_count=get("resting_orders_count") or 0,
+            last_updated_ts=get("last_updated_ts"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class QueuePosition:
+    """Compact, read-only view of one resting order's queue position."""
+    order_id: str
+    market_ticker: str = ""
+    queue_position: int = 0
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "QueuePosition":
+        """Build from a raw queue position dict, ignoring unknown fields."""
+        get = data.get
+        return cls(
+            order_id=data["order_id"],
+            market_ticker=get("market_ticker") or "",
+            queue_position=get("queue_position") or 0,
+        )
+
+
+class _TokenBucket:
+    """
+    Token bucket allowing bursts of ``capacity`` requests at ``rate`` per second.
+
+    Each caller reserves a token up front and sleeps only for its own share
+    of the deficit, so waiting callers never block each other.
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_updated")
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class _AdaptiveLimiter:
+    """
+    Concurrency limit tuned by AIMD from server feedback.
+
+    Every ``window`` uncongested responses raise the limit by ``increase``;
+    each 429/5xx halves it. Limits stay within [minimum, maximum].
+    """
+
+    __slots__ = (
+        "limit", "minimum", "maximum", "window", "increase",
+        "_in_flight", "_successes", "_waiters",
+    )
+
+    def __init__(
+        self,
+        initial: float = 8,
+        minimum: float = 1,
+        maximum: float = 64,
+        window: int = 30,
+        increase: float = 0.5
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window = window
+        self.increase = increase
+        self._in_flight = 0
+        self._successes = 0
+        self._waiters: deque = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        while self._in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # We were woken but won't use the slot; pass it on
+                    self._wake()
+                raise
+        self._in_flight += 1
+
+    def release(self, congested: bool = False) -> None:
+        """Free a slot and feed the outcome of the request into the limit."""
+        self._in_flight -= 1
+        if congested:
+            self.limit = max(self.minimum, self.limit * 0.5)
+            self._successes = 0
+        else:
+            self._successes += 1
+            if self._successes >= self.window:
+                self.limit = min(self.maximum, self.limit + self.increase)
+                self._successes = 0
+        self._wake()
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+# One connection pool per event loop and base URL, shared by every KalshiClient
+# on it and refcounted so the last client to close shuts it down. Pooled sockets
+# belong to the loop that opened them, so a later asyncio.run() gets a fresh pool.
+# Maps (loop, base_url) -> [client, refs].
+_shared_http_clients: Dict[Tuple[Optional[asyncio.AbstractEventLoop], str], List[Any]] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _acquire_shared_http_client(
+    base_url: str,
+    loop: Optional[asyncio.AbstractEventLoop]
+) -> httpx.AsyncClient:
+    """Take a reference to the shared HTTP client for ``loop`` and ``base_url``."""
+    # Pools of finished loops can never be used or closed again
+    for stale in [key for key in _shared_http_clients if key[0] is not None and key[0].is_closed()]:
+        del _shared_http_clients[stale]
+
+    key = (loop, base_url)
+    entry = _shared_http_clients.get(key)
+    if entry is None or entry[0].is_closed:
+        # base_url is parsed once here, so each request only resolves its path
+        entry = _shared_http_clients[key] = [httpx.AsyncClient(
+            base_url=base_url,
+            # Fail fast on connect so a dead socket doesn't eat the retry budget
+            timeout=httpx.Timeout(30.0, connect=3.0),
+            http2=HTTP2_AVAILABLE,
+            # Keep idle sockets past short gaps between polls to skip TLS handshakes
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=30.0
+            )
+        ), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+def _drop_shared_http_client(
+    client: httpx.AsyncClient,
+    base_url: str,
+    loop: Optional[asyncio.AbstractEventLoop]
+) -> bool:
+    """
+    Drop a reference to the shared HTTP client for ``loop`` and ``base_url``.
+
+    Returns True when this was the last reference and the caller should
+    close the client.
+    """
+    key = (loop, base_url)
+    entry = _shared_http_clients.get(key)
+    if entry is None or entry[0] is not client:
+        # Already replaced after being closed
+        return False
+    entry[1] -= 1
+    if entry[1] > 0:
+        return False
+    del _shared_http_clients[key]
+    return True
+
+
+async def _release_shared_http_client(
+    client: httpx.AsyncClient,
+    base_url: str,
+    loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Drop a reference to the shared HTTP client, closing it on the last one."""
+    # A pool from another (finished) loop can't be closed from this one
+    if _drop_shared_http_client(client, base_url, loop) and loop is _running_loop():
+        await client.aclose()
+
 
 class KalshiAPIError(Exception):
     """Custom exception for Kalshi API errors."""
     pass
 
 
+class WebSocketSendError(KalshiAPIError):
+    """A WebSocket command frame never reached the server, so retrying it is safe."""
+    pass
+
+
 class KalshiClient(TradingLoggerMixin):
     """
     Kalshi API client for automated trading.
@@ -47,10 +592,52 @@ class KalshiClient(TradingLoggerMixin):
     - BatchCancelOrders (each cancel = 0.2 transactions)
     """
 
-    _rate_semaphore = asyncio.Semaphore(5)
-    _rate_lock = asyncio.Lock()
-    _last_request_ts = 0.0
-    _min_request_interval = 0.35  # ~2.86 req/sec (conservative for Basic tier)
+    # Fixed instance layout for the attributes read on every request. The
+    # logging mixin has no __slots__, so instances keep a __dict__ and tests
+    # or callers can still override methods per instance.
+    __slots__ = (
+        "api_key", "base_url", "private_key_path", "private_key_pem",
+        "private_key_b64", "private_key", "max_retries", "backoff_factor",
+        "_http_client", "_http_loop", "_http_released", "ws_trader", "_csv_cache", "_signature_ts", "_signatures",
+        "_ttl_cache", "_ttl_inflight", "_group_heartbeats", "_qp_window",
+        "_qp_pending", "_qp_flush", "_order_window", "_order_pending",
+        "_order_flush", "_rate_limit_floor", "_endpoint_pause_until",
+        "_inflight", "_response_cache", "_response_cache_size",
+        "_fcm_pollers", "_fcm_latest", "_fcm_refreshed",
+    )
+
+    # Account-wide request budgets shared by every client in the process
+    _rate_buckets = {
+        "read": _TokenBucket(settings.api.kalshi_read_rate_limit),
+        "write": _TokenBucket(settings.api.kalshi_write_rate_limit),
+    }
+    # Requests in flight, adapted to 429/5xx feedback
+    _concurrency = _AdaptiveLimiter()
+
+    # Most orders the batched create endpoint accepts per call
+    _BATCH_ORDER_LIMIT = 20
+
+    # Freshness window for live market and orderbook reads, in seconds
+    _MARKET_DATA_TTL = 0.25
+
+    # Upper bound on a single retry backoff, in seconds
+    _MAX_BACKOFF = 8.0
+
+    # Default wait for the next background FCM refresh, in seconds
+    _FCM_WAIT_TIMEOUT = 30.0
+
+    # Headers shared by every request; signed requests copy and extend this
+    _BASE_HEADERS = {
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    }
+
+    # RSA-PSS parameters are stateless, so every signature reuses one set
+    _PSS_PADDING = padding.PSS(
+        mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=padding.PSS.DIGEST_LENGTH
+    )
+    _SHA256 = hashes.SHA256()
 
     def __init__(
         self, 
@@ -84,31 +671,128 @@ class KalshiClient(TradingLoggerMixin):
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
 
-        # Load private key lazily on first authenticated request
-        
-        # HTTP client with timeouts
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
-        )
+        # HTTP client shared by every KalshiClient on the same event loop and
+        # base URL so they reuse one pool; taken lazily when built outside a loop
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_released = False
+        loop = _running_loop()
+        if loop is not None:
+            self._bind_http_client(loop)
+
+        # Short-lived results of slow-changing reference endpoints (see _ttl_cached)
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+        self._ttl_inflight: Dict[str, asyncio.Future] = {}
+
+        # Optional WebSocket order-entry transport (see attach_ws_trader)
+        self.ws_trader = None
+
+        # Queue-position lookups waiting to be batched (see get_order_queue_position)
+        self._qp_window = 0.005
+        self._qp_pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._qp_flush: Optional[asyncio.Task] = None
+
+        # Orders waiting to go out in one batch_create_orders call (see queue_order)
+        self._order_window = 0.02
+        self._order_pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._order_flush: Optional[asyncio.Task] = None
+
+        # Endpoints held back until their X-RateLimit-Reset (monotonic deadline)
+        self._rate_limit_floor = 2
+        self._endpoint_pause_until: Dict[str, float] = {}
+
+        # Public GETs currently on the wire, keyed by _request_key
+        self._inflight: Dict[Tuple[str, Tuple], asyncio.Future] = {}
+
+        # LRU of public GET responses with per-entry expiry (see _cached_get)
+        self._response_cache: "OrderedDict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._response_cache_size = 1024
+
+        # Background FCM pollers and their latest results (see start_fcm_polling)
+        self._fcm_pollers: Dict[str, asyncio.Task] = {}
+        self._fcm_latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._fcm_refreshed: Dict[str, asyncio.Future] = {}
+
+        # Background reset loops keyed by order group ID
+        self._group_heartbeats: Dict[str, asyncio.Task] = {}
+
+        # Comma-joined forms of ticker/tag lists reused across polling calls
+        self._csv_cache: Dict[Tuple[str, ...], str] = {}
+
+        # Signatures produced during the current millisecond, keyed by (method, path)
+        self._signature_ts = ""
+        self._signatures: Dict[Tuple[str, str], str] = {}
+
+        # Parse and exercise the key now so the first order doesn't pay for it.
+        # A failure here is retried, and raised, on the first signed request.
+        if self.private_key_pem or self.private_key_b64 or self.private_key_path:
+            try:
+                self._load_private_key()
+                self._sign_request("0", "GET", "/")
+            except KalshiAPIError:
+                pass
         
         self.logger.info("Kalshi client initialized", api_key_length=len(self.api_key) if self.api_key else 0)
 
-    async def _acquire_rate_limit(self) -> None:
-        """Acquire shared rate limit slot to reduce 429s."""
-        await KalshiClient._rate_semaphore.acquire()
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for the running event loop."""
+        loop = _running_loop()
+        if self._http_client is None or (loop is not None and loop is not self._http_loop):
+            self._bind_http_client(loop)
+        return self._http_client
+
+    def _bind_http_client(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Move this client's pool reference to ``loop``'s shared HTTP client."""
+        old_loop = self._http_loop
+        if self._http_client is not None and not self._http_released:
+            last = _drop_shared_http_client(self._http_client, self.base_url, old_loop)
+            if last and old_loop is not None and not old_loop.is_closed():
+                # Close on the loop that owns the sockets
+                asyncio.run_coroutine_threadsafe(self._http_client.aclose(), old_loop)
+        self._http_client = _acquire_shared_http_client(self.base_url, loop)
+        self._http_loop = loop
+        self._http_released = False
+
+    def attach_ws_trader(self, ws_trader: Any) -> None:
+        """
+        Route latency-critical order actions over a WebSocket transport.
+
+        Args:
+            ws_trader: Object exposing ``available`` and ``async call(cmd, params)``
+                       (e.g. KalshiWsTrader). Pass None to detach.
+        """
+        self.ws_trader = ws_trader
+
+    async def _ws_call(self, cmd: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Try to send an order action over the attached WebSocket transport.
+
+        Only a frame that was never sent falls back to HTTP. Once it is out,
+        repeating the action over HTTP could apply it twice.
+
+        Returns:
+            The response, or None if the caller should fall back to HTTP
+
+        Raises:
+            KalshiAPIError: If the server rejected the command, or the outcome
+                            of a sent command is unknown
+        """
+        ws_trader = self.ws_trader
+        if ws_trader is None or not ws_trader.available:
+            return None
         try:
-            async with KalshiClient._rate_lock:
-                now = time.monotonic()
-                elapsed = now - KalshiClient._last_request_ts
-                wait_time = KalshiClient._min_request_interval - elapsed
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                KalshiClient._last_request_ts = time.monotonic()
-        except Exception:
-            KalshiClient._rate_semaphore.release()
+            return await ws_trader.call(cmd, params)
+        except WebSocketSendError as e:
+            self.logger.warning("WebSocket order entry failed, falling back to HTTP", cmd=cmd, error=str(e))
+            return None
+        except KalshiAPIError:
             raise
-    
+        except asyncio.TimeoutError:
+            raise KalshiAPIError(f"WebSocket {cmd} timed out; order state unknown")
+        except Exception as e:
+            raise KalshiAPIError(f"WebSocket {cmd} failed after sending; order state unknown: {e}") from e
+
     def _load_private_key(self) -> None:
         """Load private key from file."""
         try:
@@ -181,6 +865,8 @@ class KalshiClient(TradingLoggerMixin):
         """
         Sign request using RSA PSS signing method as per Kalshi API docs.
 
+        Ed25519 keys are signed directly, without PSS padding.
+
         Args:
             timestamp: Request timestamp in milliseconds
             method: HTTP method
@@ -189,31 +875,134 @@ class KalshiClient(TradingLoggerMixin):
         Returns:
             Base64 encoded signature
         """
-        # CRITICAL: Strip query parameters before signing (per Kalshi Quick Start docs)
-        # "Important: Use the path without query parameters. For /portfolio/orders?limit=5,
-        # sign only /trade-api/v2/portfolio/orders"
-        path_without_query = path.split('?')[0]
-
-        # Create message to sign: timestamp + method + path
-        message = timestamp + method.upper() + path_without_query
-        message_bytes = message.encode('utf-8')
+        # Create message to sign: timestamp + method + path (query stripped)
+        message_bytes = timestamp.encode('ascii') + _canonical_prefix(method, path)
         
         try:
-            # Sign using RSA PSS as per Kalshi documentation
-            signature = self.private_key.sign(
-                message_bytes,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.DIGEST_LENGTH
-                ),
-                hashes.SHA256()
-            )
+            if isinstance(self.private_key, ed25519.Ed25519PrivateKey):
+                # Ed25519 keys sign roughly 20x faster and take no padding
+                signature = self.private_key.sign(message_bytes)
+            else:
+                # Sign using RSA PSS as per Kalshi documentation
+                signature = self.private_key.sign(
+                    message_bytes,
+                    KalshiClient._PSS_PADDING,
+                    KalshiClient._SHA256
+                )
             
             return base64.b64encode(signature).decode('utf-8')
         except Exception as e:
             self.logger.error("Failed to sign request", error=str(e))
             raise KalshiAPIError(f"Failed to sign request: {e}")
     
+    def _backoff_delay(self, attempt: int) -> float:
+        """Capped exponential backoff with full jitter."""
+        return random.uniform(0, min(self._MAX_BACKOFF, self.backoff_factor * (2 ** attempt)))
+
+    def _note_rate_limit_headers(self, endpoint: str, response: httpx.Response) -> None:
+        """Pause an endpoint when the server reports its budget nearly spent."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining_count = float(remaining)
+        except ValueError:
+            return
+        if remaining_count > self._rate_limit_floor:
+            self._endpoint_pause_until.pop(endpoint, None)
+            return
+        reset_in = _header_seconds(response.headers.get("X-RateLimit-Reset"))
+        if reset_in:
+            self._endpoint_pause_until[endpoint] = time.monotonic() + reset_in
+
+    def get_current_limit(self) -> int:
+        """Requests allowed in flight process-wide right now, as tuned by AIMD."""
+        return int(KalshiClient._concurrency.limit)
+
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = 60.0
+    ) -> Dict[str, Any]:
+        """
+        Public GET served from an in-memory LRU cache while fresh.
+
+        Callers share the cached dict and must not mutate it.
+        """
+        key = _request_key(endpoint, params)
+        entry = self._response_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._response_cache.move_to_end(key)
+            return entry[1]
+
+        result = await self._make_authenticated_request(
+            "GET",
+            endpoint,
+            params=params,
+            require_auth=False
+        )
+        self._response_cache[key] = (time.monotonic() + ttl, result)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self._response_cache_size:
+            self._response_cache.popitem(last=False)
+        return result
+
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """
+        Drop cached GET responses whose endpoint starts with ``prefix``.
+
+        Covers both the short-lived response cache and the per-method
+        results of _ttl_cached reference endpoints. With no prefix, every
+        cached response is dropped.
+        """
+        if not prefix:
+            self._response_cache.clear()
+            self._ttl_cache.clear()
+            return
+        for key in [key for key in self._response_cache if key[0].startswith(prefix)]:
+            del self._response_cache[key]
+        for endpoint in [endpoint for endpoint in self._ttl_cache if endpoint.startswith(prefix)]:
+            del self._ttl_cache[endpoint]
+
+    def _join_csv(self, values: Union[str, List[str]]) -> str:
+        """
+        Comma-join a ticker/tag list, caching the result.
+
+        Bots poll with the same ticker lists over and over, so the joined
+        string is remembered per tuple of values (bounded to 256 entries).
+        An already-joined string is passed through unchanged.
+        """
+        if isinstance(values, str):
+            return values
+        key = tuple(values)
+        joined = self._csv_cache.get(key)
+        if joined is None:
+            if len(self._csv_cache) >= 256:
+                self._csv_cache.clear()
+            joined = ",".join(key)
+            self._csv_cache[key] = joined
+        return joined
+
+    def _cached_signature(self, timestamp: str, method: str, path: str) -> str:
+        """
+        Return a signature for (timestamp, method, path), signing at most once.
+
+        The signed message is timestamp + method + path, so requests to the
+        same endpoint within the same millisecond can share one RSA-PSS
+        signature. The cache only holds entries for the current timestamp.
+        """
+        if timestamp != self._signature_ts:
+            self._signature_ts = timestamp
+            self._signatures = {}
+
+        key = (method, path)
+        signature = self._signatures.get(key)
+        if signature is None:
+            signature = self._sign_request(timestamp, method, path)
+            self._signatures[key] = signature
+        return signature
+
     async def _make_authenticated_request(
         self,
         method: str,
@@ -224,6 +1013,9 @@ class KalshiClient(TradingLoggerMixin):
     ) -> Dict[str, Any]:
         """
         Make authenticated request to Kalshi API with retry logic.
+
+        Identical public GETs issued while one is already in flight share its
+        response instead of sending a second request.
         
         Args:
             method: HTTP method
@@ -235,88 +1027,142 @@ class KalshiClient(TradingLoggerMixin):
         Returns:
             API response data
         """
-        # Prepare request
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        
-        # Add authentication headers if required
-        if require_auth:
-            if self.private_key is None:
-                self._load_private_key()
-            # Get current timestamp in milliseconds
-            timestamp = str(int(time.time() * 1000))
-            
-            # Create signature
-            signature = self._sign_request(timestamp, method, endpoint)
-            
-            headers.update({
-                "KALSHI-ACCESS-KEY": self.api_key,
-                "KALSHI-ACCESS-TIMESTAMP": timestamp,
-                "KALSHI-ACCESS-SIGNATURE": signature
-            })
+        if method != "GET" or require_auth:
+            return await self._send_request(method, endpoint, params, json_data, require_auth)
+
+        return await self._single_flight(
+            _request_key(endpoint, params),
+            lambda: self._send_request(method, endpoint, params, json_data, require_auth)
+        )
+
+    async def _single_flight(
+        self,
+        key: Tuple[str, Tuple],
+        start: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Share one in-flight call among concurrent callers with the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(start())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict],
+        require_auth: bool
+    ) -> Dict[str, Any]:
+        """Sign, send and retry a single API request."""
+        headers = self._BASE_HEADERS
+        if require_auth and self.private_key is None:
+            self._load_private_key()
         
         # Prepare body
         body = None
         if json_data:
-            body = json.dumps(json_data, separators=(',', ':'))
-        
-        # Add query parameters to URL if present
-        if params:
-            query_string = urlencode(params)
-            url = f"{url}?{query_string}"
+            body = _json_dumps(json_data)
         
         last_exception = None
+        resigned = False
         for attempt in range(self.max_retries):
             try:
-                self.logger.debug(
-                    "Making API request",
-                    method=method,
-                    endpoint=endpoint,
-                    has_auth=require_auth,
-                    attempt=attempt + 1
-                )
-                
-                # Add delay between requests to prevent 429s (Basic tier: 10 writes/sec)
-                await asyncio.sleep(0.1)  # 100ms delay = max 10 requests/second
+                if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Making API request",
+                        method=method,
+                        endpoint=endpoint,
+                        has_auth=require_auth,
+                        attempt=attempt + 1
+                    )
                 
-                response = await self.client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    content=body if body else None
-                )
+                await KalshiClient._rate_buckets[
+                    "read" if method in ("GET", "HEAD") else "write"
+                ].acquire()
+
+                # Server said this endpoint's budget is nearly spent; wait for the reset
+                pause = self._endpoint_pause_until.get(endpoint, 0.0) - time.monotonic()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+
+                if require_auth:
+                    # Sign each attempt after any waits, so a long backoff
+                    # never sends a timestamp outside the signing window
+                    timestamp = str(time.time_ns() // 1_000_000)
+                    headers = {
+                        **self._BASE_HEADERS,
+                        "KALSHI-ACCESS-KEY": self.api_key,
+                        "KALSHI-ACCESS-TIMESTAMP": timestamp,
+                        "KALSHI-ACCESS-SIGNATURE": self._cached_signature(timestamp, method, endpoint)
+                    }
+
+                response = None
+                await KalshiClient._concurrency.acquire()
+                try:
+                    # httpx encodes params straight into the URL it builds
+                    response = await self.client.request(
+                        method=method,
+                        url=endpoint,
+                        params=params,
+                        headers=headers,
+                        content=body if body else None
+                    )
+                finally:
+                    KalshiClient._concurrency.release(
+                        congested=response is not None
+                        and (response.status_code == 429 or response.status_code >= 500)
+                    )
+                self._note_rate_limit_headers(endpoint, response)
 
                 # Per Kalshi Quick Start: raise_for_status() handles all 2xx codes including
                 # 201 (order creation success) and 200 (general success)
                 response.raise_for_status()
-                return response.json()
+                content = response.content
+                if not content:
+                    # e.g. DELETE/PUT endpoints documented as returning an empty dict
+                    return {}
+                return _json_loads(content)
                 
             except httpx.HTTPStatusError as e:
                 last_exception = e
                 record_failure("kalshi")
-                # Rate limit (429) or server errors (5xx) are worth retrying
-                if e.response.status_code == 429 or e.response.status_code >= 500:
-                    sleep_time = self.backoff_factor * (2 ** attempt)
-                    self.logger.warning(
-                        f"API request failed with status {e.response.status_code}. Retrying in {sleep_time:.2f}s...",
-                        endpoint=endpoint,
-                        attempt=attempt + 1
-                    )
-                    await asyncio.sleep(sleep_time)
+                status_code = e.response.status_code
+                policy = _RETRY_POLICY.get(status_code, "idempotent" if status_code >= 500 else None)
+                if policy == "resign" and require_auth and not resigned:
+                    # Likely a timestamp that aged out; the next attempt re-signs
+                    resigned = True
+                    sleep_time = 0.0
+                elif policy == "any" or (policy == "idempotent" and method == "GET"):
+                    # Sleep exactly as long as the server asks, when it says
+                    sleep_time = _header_seconds(e.response.headers.get("Retry-After"))
+                    if sleep_time is None:
+                        sleep_time = self._backoff_delay(attempt)
                 else:
-                    # Don't retry on other client errors (e.g., 400, 401, 404)
-                    error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+                    # Don't retry on other client errors (e.g., 400, 404)
+                    error_msg = f"HTTP {status_code}: {e.response.text}"
                     self.logger.error("API request failed without retry", error=error_msg, endpoint=endpoint)
                     raise KalshiAPIError(error_msg)
+                self.logger.warning(
+                    "API request failed, retrying",
+                    status=status_code,
+                    sleep_seconds=round(sleep_time, 2),
+                    endpoint=endpoint,
+                    attempt=attempt + 1
+                )
+                await asyncio.sleep(sleep_time)
             except Exception as e:
                 last_exception = e
                 record_failure("kalshi")
-                self.logger.warning(f"Request failed with general exception. Retrying...", error=str(e), endpoint=endpoint)
-                sleep_time = self.backoff_factor * (2 ** attempt)
-                await asyncio.sleep(sleep_time)
+                if method != "GET":
+                    # The request may have reached the exchange; resending could duplicate it
+                    self.logger.error("API request failed without retry", error=str(e), endpoint=endpoint)
+                    raise KalshiAPIError(f"{method} {endpoint} failed: {e}") from e
+                self.logger.warning("Request failed with general exception. Retrying...", error=str(e), endpoint=endpoint)
+                await asyncio.sleep(self._backoff_delay(attempt))
         
         raise KalshiAPIError(f"API request failed after {self.max_retries} retries: {last_exception}")
     
@@ -382,15 +1228,15 @@ class KalshiClient(TradingLoggerMixin):
             # Get positions for specific market
             result = await client.get_positions(ticker="KXHIGHNY-24JAN01-T60")
         """
-        params = {"limit": limit}
-        if ticker:
-            params["ticker"] = ticker
-        if event_ticker:
-            params["event_ticker"] = event_ticker
-        if count_filter:
-            params["count_filter"] = count_filter
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "limit": limit,
+            **_query_params(
+                ticker=ticker,
+                event_ticker=event_ticker,
+                count_filter=count_filter,
+                cursor=cursor
+            )
+        }
         return await self._make_authenticated_request("GET", "/trade-api/v2/portfolio/positions", params=params)
     
     async def get_fills(
@@ -430,17 +1276,16 @@ class KalshiClient(TradingLoggerMixin):
             # Get fills for specific market
             result = await client.get_fills(ticker="KXHIGHNY-24JAN01-T60")
         """
-        params = {"limit": limit}
-        if ticker:
-            params["ticker"] = ticker
-        if order_id:
-            params["order_id"] = order_id
-        if min_ts:
-            params["min_ts"] = min_ts
-        if max_ts:
-            params["max_ts"] = max_ts
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "limit": limit,
+            **_query_params(
+                ticker=ticker,
+                order_id=order_id,
+                min_ts=min_ts,
+                max_ts=max_ts,
+                cursor=cursor
+            )
+        }
         return await self._make_authenticated_request("GET", "/trade-api/v2/portfolio/fills", params=params)
 
     async def get_settlements(
@@ -478,17 +1323,16 @@ class KalshiClient(TradingLoggerMixin):
                 print(f"{settlement['ticker']}: {settlement['market_result']}")
                 print(f"  Revenue: ${settlement['revenue']/100:.2f}")
         """
-        params = {"limit": limit}
-        if ticker:
-            params["ticker"] = ticker
-        if event_ticker:
-            params["event_ticker"] = event_ticker
-        if min_ts:
-            params["min_ts"] = min_ts
-        if max_ts:
-            params["max_ts"] = max_ts
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "limit": limit,
+            **_query_params(
+                ticker=ticker,
+                event_ticker=event_ticker,
+                min_ts=min_ts,
+                max_ts=max_ts,
+                cursor=cursor
+            )
+        }
 
         return await self._make_authenticated_request(
             "GET",
@@ -553,20 +1397,17 @@ class KalshiClient(TradingLoggerMixin):
             for order in result['orders']:
                 print(f"Order {order['order_id']}: {order['ticker']}")
         """
-        params = {"limit": min(limit, 200)}  # Enforce max limit
-
-        if ticker:
-            params["ticker"] = ticker
-        if event_ticker:
-            params["event_ticker"] = event_ticker
-        if min_ts:
-            params["min_ts"] = min_ts
-        if max_ts:
-            params["max_ts"] = max_ts
-        if status:
-            params["status"] = status
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "limit": min(limit, 200),  # Enforce max limit
+            **_query_params(
+                ticker=ticker,
+                event_ticker=event_ticker,
+                min_ts=min_ts,
+                max_ts=max_ts,
+                status=status,
+                cursor=cursor
+            )
+        }
 
         return await self._make_authenticated_request(
             "GET",
@@ -593,7 +1434,7 @@ class KalshiClient(TradingLoggerMixin):
         """
         return await self._make_authenticated_request(
             "GET",
-            f"/trade-api/v2/portfolio/orders/{order_id}"
+            _ORDER_PATH % order_id
         )
     
     async def get_markets(
@@ -609,8 +1450,9 @@ class KalshiClient(TradingLoggerMixin):
         min_settled_ts: Optional[int] = None,
         max_settled_ts: Optional[int] = None,
         status: Optional[str] = None,
-        tickers: Optional[List[str]] = None,
-        mve_filter: Optional[str] = None
+        tickers: Optional[Union[str, List[str]]] = None,
+        mve_filter: Optional[str] = None,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         Get markets data with filtering and pagination.
@@ -634,6 +1476,7 @@ class KalshiClient(TradingLoggerMixin):
             status: Filter by status (unopened, open, paused, closed, settled)
             tickers: List of specific market tickers (comma-separated)
             mve_filter: Filter multivariate events ('only' or 'exclude')
+            as_dataclass: Return markets as MarketSnapshot objects
 
         Returns:
             Dict with:
@@ -652,41 +1495,42 @@ class KalshiClient(TradingLoggerMixin):
                 status="open"
             )
         """
-        params = {"limit": limit}
-
-        if cursor:
-            params["cursor"] = cursor
-        if event_ticker:
-            params["event_ticker"] = event_ticker
-        if series_ticker:
-            params["series_ticker"] = series_ticker
-        if min_created_ts:
-            params["min_created_ts"] = min_created_ts
-        if max_created_ts:
-            params["max_created_ts"] = max_created_ts
-        if max_close_ts:
-            params["max_close_ts"] = max_close_ts
-        if min_close_ts:
-            params["min_close_ts"] = min_close_ts
-        if min_settled_ts:
-            params["min_settled_ts"] = min_settled_ts
-        if max_settled_ts:
-            params["max_settled_ts"] = max_settled_ts
-        if status:
-            params["status"] = status
-        if tickers:
-            params["tickers"] = ",".join(tickers)
-        if mve_filter:
-            params["mve_filter"] = mve_filter
+        params = {
+            "limit": limit,
+            **_query_params(
+                cursor=cursor,
+                event_ticker=event_ticker,
+                series_ticker=series_ticker,
+                min_created_ts=min_created_ts,
+                max_created_ts=max_created_ts,
+                max_close_ts=max_close_ts,
+                min_close_ts=min_close_ts,
+                min_settled_ts=min_settled_ts,
+                max_settled_ts=max_settled_ts,
+                status=status,
+                tickers=tickers and self._join_csv(tickers),
+                mve_filter=mve_filter
+            )
+        }
 
-        return await self._make_authenticated_request(
+        result = await self._make_authenticated_request(
             "GET", "/trade-api/v2/markets", params=params, require_auth=True
         )
+        if as_dataclass:
+            result["markets"] = [
+                MarketSnapshot.from_api(market) for market in result.get("markets") or []
+            ]
+        return result
     
     async def get_market(self, ticker: str) -> Dict[str, Any]:
-        """Get specific market data."""
-        return await self._make_authenticated_request(
-            "GET", f"/trade-api/v2/markets/{ticker}", require_auth=False
+        """
+        Get specific market data.
+
+        Concurrent and back-to-back lookups of one ticker within
+        _MARKET_DATA_TTL share a response; treat it as read-only.
+        """
+        return await self._cached_get(
+            f"/trade-api/v2/markets/{ticker}", ttl=self._MARKET_DATA_TTL
         )
 
     async def get_events(
@@ -727,19 +1571,17 @@ class KalshiClient(TradingLoggerMixin):
                 with_nested_markets=True
             )
         """
-        params = {"limit": limit}
-        if cursor:
-            params["cursor"] = cursor
-        if with_nested_markets:
-            params["with_nested_markets"] = "true"
-        if with_milestones:
-            params["with_milestones"] = "true"
-        if status:
-            params["status"] = status
-        if series_ticker:
-            params["series_ticker"] = series_ticker
-        if min_close_ts:
-            params["min_close_ts"] = min_close_ts
+        params = {
+            "limit": limit,
+            **_query_params(
+                cursor=cursor,
+                with_nested_markets=with_nested_markets and "true",
+                with_milestones=with_milestones and "true",
+                status=status,
+                series_ticker=series_ticker,
+                min_close_ts=min_close_ts
+            )
+        }
 
         return await self._make_authenticated_request(
             "GET",
@@ -781,15 +1623,15 @@ class KalshiClient(TradingLoggerMixin):
                 with_nested_markets=True
             )
         """
-        params = {"limit": limit}
-        if cursor:
-            params["cursor"] = cursor
-        if series_ticker:
-            params["series_ticker"] = series_ticker
-        if collection_ticker:
-            params["collection_ticker"] = collection_ticker
-        if with_nested_markets:
-            params["with_nested_markets"] = "true"
+        params = {
+            "limit": limit,
+            **_query_params(
+                cursor=cursor,
+                series_ticker=series_ticker,
+                collection_ticker=collection_ticker,
+                with_nested_markets=with_nested_markets and "true"
+            )
+        }
 
         return await self._make_authenticated_request(
             "GET",
@@ -825,9 +1667,7 @@ class KalshiClient(TradingLoggerMixin):
                 with_nested_markets=True
             )
         """
-        params = {}
-        if with_nested_markets:
-            params["with_nested_markets"] = "true"
+        params = _query_params(with_nested_markets=with_nested_markets and "true")
 
         return await self._make_authenticated_request(
             "GET",
@@ -892,9 +1732,10 @@ class KalshiClient(TradingLoggerMixin):
             # Get top 10 levels
             book = await client.get_orderbook("MARKET-TICKER", depth=10)
         """
-        params = {"depth": depth}
-        return await self._make_authenticated_request(
-            "GET", f"/trade-api/v2/markets/{ticker}/orderbook", params=params, require_auth=False
+        # Pricing loops re-read the same book; a very short TTL absorbs the repeats
+        return await self._cached_get(
+            f"/trade-api/v2/markets/{ticker}/orderbook", {"depth": depth},
+            ttl=self._MARKET_DATA_TTL
         )
     
     async def get_market_history(
@@ -916,11 +1757,7 @@ class KalshiClient(TradingLoggerMixin):
         Returns:
             Price history data
         """
-        params = {"limit": limit}
-        if start_ts:
-            params["start_ts"] = start_ts
-        if end_ts:
-            params["end_ts"] = end_ts
+        params = {"limit": limit, **_query_params(start_ts=start_ts, end_ts=end_ts)}
         
         return await self._make_authenticated_request(
             "GET", f"/trade-api/v2/markets/{ticker}/history", params=params, require_auth=False
@@ -985,7 +1822,7 @@ class KalshiClient(TradingLoggerMixin):
 
     async def get_batch_market_candlesticks(
         self,
-        market_tickers: List[str],
+        market_tickers: Union[str, List[str]],
         start_ts: int,
         end_ts: int,
         period_interval: int,
@@ -997,7 +1834,8 @@ class KalshiClient(TradingLoggerMixin):
         Per Kalshi API: Max 100 tickers per request, returns up to 10,000 total candlesticks.
 
         Args:
-            market_tickers: List of market tickers (max 100)
+            market_tickers: List of market tickers, or an already comma-joined
+                            string (max 100)
             start_ts: Start timestamp (Unix seconds)
             end_ts: End timestamp (Unix seconds)
             period_interval: Candlestick period in minutes (>= 1)
@@ -1017,11 +1855,16 @@ class KalshiClient(TradingLoggerMixin):
                 period_interval=1440  # 1 day
             )
         """
-        if len(market_tickers) > 100:
+        # A pre-joined string must be counted by ticker, not by character
+        ticker_count = (
+            market_tickers.count(",") + 1 if isinstance(market_tickers, str)
+            else len(market_tickers)
+        )
+        if ticker_count > 100:
             raise ValueError("Maximum 100 market tickers allowed")
 
         params = {
-            "market_tickers": ",".join(market_tickers),
+            "market_tickers": self._join_csv(market_tickers),
             "start_ts": start_ts,
             "end_ts": end_ts,
             "period_interval": period_interval
@@ -1123,15 +1966,15 @@ class KalshiClient(TradingLoggerMixin):
                 limit=50
             )
         """
-        params = {"limit": limit}
-        if cursor:
-            params["cursor"] = cursor
-        if ticker:
-            params["ticker"] = ticker
-        if min_ts:
-            params["min_ts"] = min_ts
-        if max_ts:
-            params["max_ts"] = max_ts
+        params = {
+            "limit": limit,
+            **_query_params(
+                cursor=cursor,
+                ticker=ticker,
+                min_ts=min_ts,
+                max_ts=max_ts
+            )
+        }
 
         return await self._make_authenticated_request(
             "GET",
@@ -1376,39 +2219,29 @@ class KalshiClient(TradingLoggerMixin):
             order_data["no_price"] = validate_price(order_data["no_price"], "no_price")
 
         # 4. Handle LIMIT orders
+        price_field = _SIDE_PRICE_FIELD[side_l]
         if order_type == "limit":
-            if side_l == "yes" and "yes_price" not in order_data:
-                raise ValueError("Limit YES orders require yes_price")
-            if side_l == "no" and "no_price" not in order_data:
-                raise ValueError("Limit NO orders require no_price")
+            if price_field not in order_data:
+                raise ValueError(f"Limit {side_l.upper()} orders require {price_field}")
 
         # 5. Handle MARKET orders (both BUY and SELL!)
         if order_type == "market":
+            # Buys cap at 99¢, sells accept down to 1¢ so they fill fast
+            order_data.setdefault(price_field, _MARKET_ORDER_PRICE[action_l])
             if action_l == "buy":
-                # For market BUY orders, set the side-specific price to max (99¢)
-                if side_l == "yes" and "yes_price" not in order_data:
-                    order_data["yes_price"] = 99  # Max willing to pay for YES
-                elif side_l == "no" and "no_price" not in order_data:
-                    order_data["no_price"] = 99  # Max willing to pay for NO
-
                 # Set buy_max_cost for additional safety
-                if "buy_max_cost" not in order_data:
-                    order_data["buy_max_cost"] = count_int * 99
-
-            elif action_l == "sell":
-                # ⚠️ CRITICAL FIX: Market SELL orders also need prices!
-                # For market SELL orders, set the side-specific price to min (1¢) to sell fast
-                if side_l == "yes" and "yes_price" not in order_data:
-                    order_data["yes_price"] = 1  # Min willing to accept for YES
-                elif side_l == "no" and "no_price" not in order_data:
-                    order_data["no_price"] = 1  # Min willing to accept for NO
+                order_data.setdefault("buy_max_cost", count_int * 99)
 
         # 🔧 CRITICAL FIX: ALL orders require time_in_force (official Kalshi API requires full string)
         if "time_in_force" not in order_data:
             order_data["time_in_force"] = "good_till_canceled"  # Official Kalshi API value
 
         # DEBUG: Log the exact order data being sent
-        self.logger.info(f"📤 Sending order to Kalshi API: {order_data}")
+        self.logger.info("📤 Sending order to Kalshi API", order=order_data)
+
+        ws_result = await self._ws_call("create_order", order_data)
+        if ws_result is not None:
+            return ws_result
 
         return await self._make_authenticated_request(
             "POST", "/trade-api/v2/portfolio/orders", json_data=order_data
@@ -1416,8 +2249,12 @@ class KalshiClient(TradingLoggerMixin):
     
     async def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """Cancel an order."""
+        ws_result = await self._ws_call("cancel_order", {"order_id": order_id})
+        if ws_result is not None:
+            return ws_result
+
         return await self._make_authenticated_request(
-            "DELETE", f"/trade-api/v2/portfolio/orders/{order_id}"
+            "DELETE", _ORDER_PATH % order_id
         )
     
     async def place_smart_limit_order(
@@ -1522,7 +2359,8 @@ class KalshiClient(TradingLoggerMixin):
         action: str,
         total_count: int,
         chunk_size: int = 5,
-        delay_seconds: float = 2.0
+        delay_seconds: Optional[float] = None,
+        max_parallel_chunks: int = 4
     ) -> list:
         """
         Place large order in smaller chunks to reduce market impact.
@@ -1535,7 +2373,11 @@ class KalshiClient(TradingLoggerMixin):
             action: "buy" or "sell"
             total_count: Total contracts to trade
             chunk_size: Contracts per chunk (default 5)
-            delay_seconds: Delay between chunks (default 2s)
+            delay_seconds: Delay between chunks. When set, chunks go out one at
+                a time and stop at the first failure; when None (default),
+                chunks are paced only by the write rate limit
+            max_parallel_chunks: Chunks in flight at once when delay_seconds
+                is None (default 4)
 
         Returns:
             List of order responses
@@ -1547,42 +2389,53 @@ class KalshiClient(TradingLoggerMixin):
         """
         import uuid
 
-        orders = []
-        remaining = total_count
+        chunks = [
+            min(chunk_size, total_count - placed)
+            for placed in range(0, total_count, chunk_size)
+        ]
 
         self.logger.info(
-            f"🔪 Iceberg order: {total_count} contracts in chunks of {chunk_size}"
+            "🔪 Iceberg order", total_count=total_count, chunk_size=chunk_size, chunks=len(chunks)
         )
 
-        while remaining > 0:
-            chunk = min(chunk_size, remaining)
-
-            try:
-                order_id = str(uuid.uuid4())
-                response = await self.place_smart_limit_order(
-                    ticker=ticker,
-                    client_order_id=order_id,
-                    side=side,
-                    action=action,
-                    count=chunk
-                )
-
-                orders.append(response)
-                remaining -= chunk
-
-                self.logger.info(
-                    f"✅ Iceberg chunk placed: {chunk} contracts "
-                    f"({total_count - remaining}/{total_count} complete)"
-                )
+        async def place_chunk(chunk: int) -> Dict[str, Any]:
+            return await self.place_smart_limit_order(
+                ticker=ticker,
+                client_order_id=str(uuid.uuid4()),
+                side=side,
+                action=action,
+                count=chunk
+            )
 
-                if remaining > 0:
+        orders = []
+        if delay_seconds is not None:
+            for index, chunk in enumerate(chunks):
+                if index:
                     await asyncio.sleep(delay_seconds)
+                try:
+                    orders.append(await place_chunk(chunk))
+                except Exception as e:
+                    self.logger.error("Iceberg chunk failed", error=str(e))
+                    break
+            return orders
+
+        # The write token bucket already spaces submissions
+        semaphore = asyncio.Semaphore(max_parallel_chunks)
+
+        async def place_bounded(chunk: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await place_chunk(chunk)
+
+        results = await asyncio.gather(
+            *(place_bounded(chunk) for chunk in chunks), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error("Iceberg chunk failed", error=str(result))
+            else:
+                orders.append(result)
 
-            except Exception as e:
-                self.logger.error(f"Iceberg chunk failed: {e}")
-                # Continue with remaining chunks even if one fails
-                break
-
+        self.logger.info("✅ Iceberg order placed", chunks_placed=len(orders), chunks=len(chunks))
         return orders
 
     # ============================================================================
@@ -1618,13 +2471,76 @@ class KalshiClient(TradingLoggerMixin):
                  "action": "buy", "count": 5, "type": "market"}
             ]
             result = await client.batch_create_orders(orders)
+
+        Note:
+            Lists longer than the per-request limit are split and the slabs
+            sent concurrently; a slab that fails reports an error entry for
+            each of its orders instead of failing the whole call.
         """
-        return await self._make_authenticated_request(
-            "POST",
-            "/trade-api/v2/portfolio/orders/batched",
-            json_data={"orders": orders}
+        return await self._send_order_batches(
+            "POST", "orders", orders,
+            lambda order, error: {"client_order_id": order.get("client_order_id"), "error": error}
         )
 
+    async def queue_order(self, **order: Any) -> Dict[str, Any]:
+        """
+        Submit one order through a short-lived batch.
+
+        Orders queued within a few milliseconds of each other are sent
+        through batch_create_orders, so a burst of N orders spends a fraction
+        of N write requests. Fields are sent as given, like batch_create_orders.
+
+        Args:
+            **order: Order fields (ticker, client_order_id, side, action,
+                     count, type, prices, ...)
+
+        Returns:
+            Dict with the created order, like place_order
+
+        Raises:
+            KalshiAPIError: If the batch failed or rejected this order
+
+        Example:
+            results = await asyncio.gather(*(
+                client.queue_order(ticker=t, client_order_id=str(uuid.uuid4()),
+                                   side="yes", action="buy", count=1,
+                                   type="limit", yes_price=40)
+                for t in tickers
+            ))
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._order_pending.append((order, future))
+        if self._order_flush is None:
+            self._order_flush = asyncio.create_task(self._flush_orders())
+        return await future
+
+    async def _flush_orders(self) -> None:
+        """Send all queued orders in batches and resolve each caller."""
+        await asyncio.sleep(self._order_window)
+        pending, self._order_pending = self._order_pending, []
+        self._order_flush = None
+
+        try:
+            result = await self.batch_create_orders([order for order, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Entries come back in submission order
+        entries = result.get("orders") or []
+        for index, (_, future) in enumerate(pending):
+            if future.done():
+                continue
+            entry = entries[index] if index < len(entries) else {}
+            if entry.get("order"):
+                future.set_result({"order": entry["order"]})
+            else:
+                future.set_exception(KalshiAPIError(
+                    f"Batched order rejected: {entry.get('error') or 'missing from response'}"
+                ))
+
     async def batch_cancel_orders(self, order_ids: List[str]) -> Dict[str, Any]:
         """
         Cancel multiple orders in a single request.
@@ -1644,14 +2560,52 @@ class KalshiClient(TradingLoggerMixin):
                 "order-id-2",
                 "order-id-3"
             ])
+
+        Note:
+            Long ID lists are split and sent concurrently, as in
+            batch_create_orders.
         """
-        return await self._make_authenticated_request(
-            "DELETE",
-            "/trade-api/v2/portfolio/orders/batched",
-            json_data={"ids": order_ids}
+        return await self._send_order_batches(
+            "DELETE", "ids", order_ids,
+            lambda order_id, error: {"order_id": order_id, "error": error}
         )
 
-    # ============================================================================
+    async def _send_order_batches(
+        self,
+        method: str,
+        field: str,
+        items: List[Any],
+        error_entry: Callable[[Any, Dict[str, str]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Send items to the batched orders endpoint in _BATCH_ORDER_LIMIT slabs.
+
+        Per-order results are merged in input order under "orders"; each item
+        of a failed slab gets error_entry(item, {"message": ...}) instead.
+        """
+        limit = self._BATCH_ORDER_LIMIT
+        if len(items) <= limit:
+            return await self._make_authenticated_request(
+                method, _BATCHED_ORDERS_PATH, json_data={field: items}
+            )
+
+        slabs = [items[start:start + limit] for start in range(0, len(items), limit)]
+        results = await asyncio.gather(
+            *(
+                self._make_authenticated_request(method, _BATCHED_ORDERS_PATH, json_data={field: slab})
+                for slab in slabs
+            ),
+            return_exceptions=True
+        )
+        merged: List[Dict[str, Any]] = []
+        for slab, result in zip(slabs, results):
+            if isinstance(result, Exception):
+                merged.extend(error_entry(item, {"message": str(result)}) for item in slab)
+            else:
+                merged.extend(result.get("orders") or [])
+        return {"orders": merged}
+
+    # ============================================================================
     # ORDER AMENDMENTS (Added per Kalshi API docs)
     # ============================================================================
 
@@ -1715,40 +2669,112 @@ class KalshiClient(TradingLoggerMixin):
             print(f"Old price: {result['old_order']['yes_price']}")
             print(f"New price: {result['order']['yes_price']}")
         """
-        amend_data = {
-            "ticker": ticker,
-            "side": side,
-            "action": action,
-            "client_order_id": client_order_id,
-            "updated_client_order_id": updated_client_order_id
-        }
-
         # Exactly one price field must be provided (per API docs)
-        price_fields = [yes_price, no_price, yes_price_dollars, no_price_dollars]
-        if sum(x is not None for x in price_fields) != 1:
+        provided_count = (
+            (yes_price is not None) + (no_price is not None)
+            + (yes_price_dollars is not None) + (no_price_dollars is not None)
+        )
+        if provided_count != 1:
             raise ValueError(
                 "Exactly one of yes_price, no_price, yes_price_dollars, "
                 "or no_price_dollars must be provided"
             )
 
         if yes_price is not None:
-            amend_data["yes_price"] = yes_price
-        if no_price is not None:
-            amend_data["no_price"] = no_price
-        if yes_price_dollars is not None:
-            amend_data["yes_price_dollars"] = yes_price_dollars
-        if no_price_dollars is not None:
-            amend_data["no_price_dollars"] = no_price_dollars
+            price_field, price = "yes_price", yes_price
+        elif no_price is not None:
+            price_field, price = "no_price", no_price
+        elif yes_price_dollars is not None:
+            price_field, price = "yes_price_dollars", yes_price_dollars
+        else:
+            price_field, price = "no_price_dollars", no_price_dollars
 
+        amend_data = {
+            "ticker": ticker,
+            "side": side,
+            "action": action,
+            "client_order_id": client_order_id,
+            "updated_client_order_id": updated_client_order_id,
+            price_field: price
+        }
         if count is not None:
             amend_data["count"] = count
 
+        ws_result = await self._ws_call("amend_order", {"order_id": order_id, **amend_data})
+        if ws_result is not None:
+            return ws_result
+
         return await self._make_authenticated_request(
             "POST",
-            f"/trade-api/v2/portfolio/orders/{order_id}/amend",
+            _AMEND_ORDER_PATH % order_id,
             json_data=amend_data
         )
 
+    def make_amender(
+        self,
+        ticker: str,
+        side: str,
+        action: str,
+        client_order_id: str,
+        price_field: str = "yes_price"
+    ) -> Callable[[str, str, Union[int, str], int], Awaitable[Dict[str, Any]]]:
+        """
+        Build an amend function specialized for one (ticker, side, action).
+
+        Market makers re-quote the same instrument many times with only the
+        price and count changing, so the constant fields are captured once and
+        each call only copies the template and fills in the varying keys.
+
+        Args:
+            ticker: Market ticker
+            side: "yes" or "no"
+            action: "buy" or "sell"
+            client_order_id: Original client-specified order ID
+            price_field: Which price field to send (yes_price, no_price,
+                yes_price_dollars or no_price_dollars)
+
+        Returns:
+            Coroutine function amend(order_id, updated_client_order_id, price, count)
+
+        Example:
+            amend = client.make_amender("MARKET-TICKER", "yes", "buy", "original-id")
+            await amend("order-123", "new-id", 55, 15)
+        """
+        if price_field not in ("yes_price", "no_price", "yes_price_dollars", "no_price_dollars"):
+            raise ValueError(f"Invalid price_field: {price_field}")
+
+        base = {
+            "ticker": ticker,
+            "side": side,
+            "action": action,
+            "client_order_id": client_order_id,
+        }
+
+        async def amend(
+            order_id: str,
+            updated_client_order_id: str,
+            price: Union[int, str],
+            count: int
+        ) -> Dict[str, Any]:
+            amend_data = {
+                **base,
+                "updated_client_order_id": updated_client_order_id,
+                price_field: price,
+                "count": count
+            }
+
+            ws_result = await self._ws_call("amend_order", {"order_id": order_id, **amend_data})
+            if ws_result is not None:
+                return ws_result
+
+            return await self._make_authenticated_request(
+                "POST",
+                _AMEND_ORDER_PATH % order_id,
+                json_data=amend_data
+            )
+
+        return amend
+
     async def decrease_order(
         self,
         order_id: str,
@@ -1784,26 +2810,105 @@ class KalshiClient(TradingLoggerMixin):
             # Cancel order completely (reduce to 0)
             await client.decrease_order("order-123", reduce_to=0)
         """
-        if (reduce_by is None and reduce_to is None) or \
-           (reduce_by is not None and reduce_to is not None):
+        decrease_data = {
+            k: v for k, v in (("reduce_by", reduce_by), ("reduce_to", reduce_to))
+            if v is not None
+        }
+        if len(decrease_data) != 1:
             raise ValueError("Exactly one of reduce_by or reduce_to must be provided")
+        if decrease_data.get("reduce_by", 1) < 1:
+            raise ValueError("reduce_by must be >= 1")
+        if decrease_data.get("reduce_to", 0) < 0:
+            raise ValueError("reduce_to must be >= 0")
 
-        decrease_data = {}
-        if reduce_by is not None:
-            if reduce_by < 1:
-                raise ValueError("reduce_by must be >= 1")
-            decrease_data["reduce_by"] = reduce_by
-        if reduce_to is not None:
-            if reduce_to < 0:
-                raise ValueError("reduce_to must be >= 0")
-            decrease_data["reduce_to"] = reduce_to
+        ws_result = await self._ws_call("decrease_order", {"order_id": order_id, **decrease_data})
+        if ws_result is not None:
+            return ws_result
 
         return await self._make_authenticated_request(
             "POST",
-            f"/trade-api/v2/portfolio/orders/{order_id}/decrease",
+            _DECREASE_ORDER_PATH % order_id,
             json_data=decrease_data
         )
 
+    async def amend_orders(
+        self,
+        amendments: List[Dict[str, Any]],
+        max_concurrency: int = 16,
+        mids: Optional[Dict[str, float]] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Amend many resting orders concurrently.
+
+        There is no batch amend endpoint, so each amendment is its own
+        request; running them side by side costs about one round trip
+        instead of one per order. With mids, amends priced nearest the mid
+        are sent first, since those are the quotes most likely to trade.
+
+        Args:
+            amendments: Keyword arguments for amend_order(), one dict per order
+            max_concurrency: Amends in flight at once (default 16)
+            mids: Optional YES mid price in cents per ticker, for send priority
+
+        Returns:
+            One entry per amendment, in order: the amend_order() result, or
+            the exception it raised. A failure never cancels the others.
+
+        Example:
+            results = await client.amend_orders([
+                {"order_id": "o1", "ticker": "MKT", "side": "yes", "action": "buy",
+                 "client_order_id": "c1", "updated_client_order_id": "c1b", "yes_price": 41},
+                ...
+            ])
+        """
+        if not mids:
+            return await self._gather_settled(self.amend_order, amendments, max_concurrency)
+
+        # Gather starts calls in list order, so sorting sets the send order
+        send_order = sorted(
+            range(len(amendments)),
+            key=lambda index: _distance_to_mid(amendments[index], mids)
+        )
+        sent = await self._gather_settled(
+            self.amend_order, [amendments[index] for index in send_order], max_concurrency
+        )
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(amendments)
+        for position, index in enumerate(send_order):
+            results[index] = sent[position]
+        return results
+
+    async def decrease_orders(
+        self,
+        decreases: List[Dict[str, Any]],
+        max_concurrency: int = 16
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Decrease many orders concurrently.
+
+        Args:
+            decreases: Keyword arguments for decrease_order(), one dict per order
+            max_concurrency: Decreases in flight at once (default 16)
+
+        Returns:
+            One entry per decrease, in order: the result or the exception raised
+        """
+        return await self._gather_settled(self.decrease_order, decreases, max_concurrency)
+
+    async def _gather_settled(
+        self,
+        method: Callable[..., Awaitable[Dict[str, Any]]],
+        calls: List[Dict[str, Any]],
+        max_concurrency: int
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Run method(**kwargs) for every call, bounded, keeping failures in place."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await method(**kwargs)
+
+        return await asyncio.gather(*(run_one(kwargs) for kwargs in calls), return_exceptions=True)
+
     # ============================================================================
     # ORDER GROUPS (Risk Management - API Part 3)
     # ============================================================================
@@ -1888,7 +2993,7 @@ class KalshiClient(TradingLoggerMixin):
         """
         return await self._make_authenticated_request(
             "GET",
-            f"/trade-api/v2/portfolio/order_groups/{order_group_id}"
+            _ORDER_GROUP_PATH % order_group_id
         )
 
     async def delete_order_group(self, order_group_id: str) -> Dict[str, Any]:
@@ -1906,9 +3011,10 @@ class KalshiClient(TradingLoggerMixin):
         Example:
             await client.delete_order_group("group-123")
         """
+        self.stop_order_group_heartbeat(order_group_id)
         return await self._make_authenticated_request(
             "DELETE",
-            f"/trade-api/v2/portfolio/order_groups/{order_group_id}"
+            _ORDER_GROUP_PATH % order_group_id
         )
 
     async def reset_order_group(self, order_group_id: str) -> Dict[str, Any]:
@@ -1931,12 +3037,54 @@ class KalshiClient(TradingLoggerMixin):
             await client.reset_order_group("group-123")
             # Can now place new orders up to contracts_limit again
         """
+        ws_result = await self._ws_call("reset_order_group", {"order_group_id": order_group_id})
+        if ws_result is not None:
+            return ws_result
+
         return await self._make_authenticated_request(
             "PUT",
-            f"/trade-api/v2/portfolio/order_groups/{order_group_id}/reset",
+            _RESET_ORDER_GROUP_PATH % order_group_id,
             json_data={}
         )
 
+    def start_order_group_heartbeat(self, order_group_id: str, interval: float) -> None:
+        """
+        Reset an order group every ``interval`` seconds in the background.
+
+        Resets go over the attached WebSocket transport when it is connected
+        and fall back to HTTP otherwise. The heartbeat stops when the group is
+        deleted or the client is closed.
+
+        Args:
+            order_group_id: Order group ID to keep resetting
+            interval: Seconds between resets
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.stop_order_group_heartbeat(order_group_id)
+        self._group_heartbeats[order_group_id] = asyncio.create_task(
+            self._order_group_heartbeat(order_group_id, interval)
+        )
+
+    def stop_order_group_heartbeat(self, order_group_id: str) -> None:
+        """Stop the background reset loop for an order group, if running."""
+        task = self._group_heartbeats.pop(order_group_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _order_group_heartbeat(self, order_group_id: str, interval: float) -> None:
+        """Periodically reset an order group until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reset_order_group(order_group_id)
+            except Exception as e:
+                self.logger.warning(
+                    "Order group heartbeat reset failed",
+                    order_group_id=order_group_id,
+                    error=str(e)
+                )
+
     # ============================================================================
     # API KEYS MANAGEMENT (API Part 4)
     # ============================================================================
@@ -2010,10 +3158,7 @@ class KalshiClient(TradingLoggerMixin):
             )
             print(f"API Key ID: {result['api_key_id']}")
         """
-        if not name:
-            raise ValueError("name cannot be empty")
-        if not public_key:
-            raise ValueError("public_key cannot be empty")
+        _require_nonempty(name=name, public_key=public_key)
 
         json_data = {
             "name": name,
@@ -2067,8 +3212,7 @@ class KalshiClient(TradingLoggerMixin):
             print(f"API Key ID: {result['api_key_id']}")
             print("⚠️  Private key saved to private_key.pem - keep secure!")
         """
-        if not name:
-            raise ValueError("name cannot be empty")
+        _require_nonempty(name=name)
 
         json_data = {"name": name}
 
@@ -2082,6 +3226,37 @@ class KalshiClient(TradingLoggerMixin):
             json_data=json_data
         )
 
+    def use_api_key(self, api_key_id: str, private_key_pem: str) -> None:
+        """
+        Switch this client to a different API key, e.g. one from generate_api_key.
+
+        The PEM is parsed once here and the loaded key object is kept for all
+        subsequent signing, so no request pays for key parsing.
+
+        Args:
+            api_key_id: The key ID to send in KALSHI-ACCESS-KEY
+            private_key_pem: Matching RSA private key in PEM format
+
+        Example:
+            result = await client.generate_api_key(name="Rotated Bot Key")
+            client.use_api_key(result['api_key_id'], result['private_key'])
+        """
+        _require_nonempty(api_key_id=api_key_id, private_key_pem=private_key_pem)
+        try:
+            private_key = serialization.load_pem_private_key(
+                self._normalize_pem_text(private_key_pem),
+                password=None
+            )
+        except Exception as e:
+            raise KalshiAPIError(f"Failed to load private key: {e}")
+
+        self.api_key = api_key_id
+        self.private_key_pem = private_key_pem
+        self.private_key = private_key
+        # Signatures made with the previous key must not be reused
+        self._signature_ts = ""
+        self._signatures.clear()
+
     async def delete_api_key(self, api_key_id: str) -> Dict[str, Any]:
         """
         Delete an API key, immediately revoking access.
@@ -2099,8 +3274,7 @@ class KalshiClient(TradingLoggerMixin):
             await client.delete_api_key("your-api-key-id")
             print("API key revoked successfully")
         """
-        if not api_key_id:
-            raise ValueError("api_key_id cannot be empty")
+        _require_nonempty(api_key_id=api_key_id)
 
         return await self._make_authenticated_request(
             "DELETE",
@@ -2111,9 +3285,10 @@ class KalshiClient(TradingLoggerMixin):
     # SEARCH & DISCOVERY (API Part 4)
     # ============================================================================
 
+    @_ttl_cached(60, "/trade-api/v2/search/tags_by_categories")
     async def get_tags_by_categories(self) -> Dict[str, Any]:
         """
-        Get all tags grouped by series categories.
+        Get all tags grouped by series categories. Cached for 60 seconds.
 
         Per Kalshi API: Returns hierarchical tag structure for filtering markets
         by topic categories (e.g., Politics, Economics, Sports).
@@ -2133,9 +3308,10 @@ class KalshiClient(TradingLoggerMixin):
             require_auth=False
         )
 
+    @_ttl_cached(60, "/trade-api/v2/search/filters_by_sport")
     async def get_filters_by_sport(self) -> Dict[str, Any]:
         """
-        Get sport-specific filter options.
+        Get sport-specific filter options. Cached for 60 seconds.
 
         Per Kalshi API: Returns available filters organized by sport, including
         scopes and competitions, plus ordered list of sports for display.
@@ -2164,14 +3340,14 @@ class KalshiClient(TradingLoggerMixin):
     async def get_series(
         self,
         category: Optional[str] = None,
-        tags: Optional[List[str]] = None,
+        tags: Optional[Union[str, List[str]]] = None,
         include_product_metadata: bool = False,
         include_volume: bool = False,
         limit: int = 100,
         cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        List all series (market categories/templates).
+        List all series (market categories/templates). Cached for 60 seconds.
 
         Per Kalshi API: Series represent templates for recurring events
         (e.g., "Monthly Jobs Report", "Weekly Initial Jobless Claims").
@@ -2195,35 +3371,25 @@ class KalshiClient(TradingLoggerMixin):
                 include_volume=True
             )
         """
-        params = {}
-        if category:
-            params["category"] = category
-        if tags:
+        params = _query_params(
+            category=category,
             # Per Oct 13, 2025 fix: tags are comma-separated
-            params["tags"] = ",".join(tags)
-        if include_product_metadata:
-            params["include_product_metadata"] = "true"
-        if include_volume:
-            params["include_volume"] = "true"
-        if limit:
-            params["limit"] = limit
-        if cursor:
-            params["cursor"] = cursor
-
-        return await self._make_authenticated_request(
-            "GET",
-            "/trade-api/v2/series",
-            params=params,
-            require_auth=False
+            tags=tags and self._join_csv(tags),
+            include_product_metadata=include_product_metadata and "true",
+            include_volume=include_volume and "true",
+            limit=limit,
+            cursor=cursor
         )
 
+        return await self._cached_get("/trade-api/v2/series", params, ttl=60.0)
+
     async def get_series_info(
         self,
         series_ticker: str,
         include_volume: bool = False
     ) -> Dict[str, Any]:
         """
-        Get detailed information about a specific series.
+        Get detailed information about a specific series. Cached for 60 seconds.
 
         Args:
             series_ticker: Series ticker (e.g., "PRES")
@@ -2232,16 +3398,9 @@ class KalshiClient(TradingLoggerMixin):
         Returns:
             Series details including markets
         """
-        params = {}
-        if include_volume:
-            params["include_volume"] = "true"
+        params = _query_params(include_volume=include_volume and "true")
 
-        return await self._make_authenticated_request(
-            "GET",
-            f"/trade-api/v2/series/{series_ticker}",
-            params=params,
-            require_auth=False
-        )
+        return await self._cached_get(f"/trade-api/v2/series/{series_ticker}", params, ttl=60.0)
 
     async def get_series_fee_changes(
         self,
@@ -2271,11 +3430,10 @@ class KalshiClient(TradingLoggerMixin):
                 show_historical=True
             )
         """
-        params = {}
-        if series_ticker:
-            params["series_ticker"] = series_ticker
-        if show_historical:
-            params["show_historical"] = "true"
+        params = _query_params(
+            series_ticker=series_ticker,
+            show_historical=show_historical and "true"
+        )
 
         return await self._make_authenticated_request(
             "GET",
@@ -2290,8 +3448,9 @@ class KalshiClient(TradingLoggerMixin):
 
     async def get_queue_positions(
         self,
-        market_tickers: Optional[List[str]] = None,
-        event_ticker: Optional[str] = None
+        market_tickers: Optional[Union[str, List[str]]] = None,
+        event_ticker: Optional[str] = None,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         Get queue positions for multiple resting limit orders.
@@ -2301,46 +3460,104 @@ class KalshiClient(TradingLoggerMixin):
         Args:
             market_tickers: Filter by market tickers
             event_ticker: Filter by event
+            as_dataclass: Return queue_positions as QueuePosition objects
 
         Returns:
             Queue positions for your orders
 
         Note: Must specify either market_tickers OR event_ticker.
         """
-        params = {}
-        if market_tickers:
-            params["market_tickers"] = ",".join(market_tickers)
-        if event_ticker:
-            params["event_ticker"] = event_ticker
+        params = _query_params(
+            market_tickers=market_tickers and self._join_csv(market_tickers),
+            event_ticker=event_ticker
+        )
 
-        return await self._make_authenticated_request(
+        result = await self._make_authenticated_request(
             "GET",
             "/trade-api/v2/portfolio/orders/queue_positions",
             params=params
         )
+        if as_dataclass:
+            result["queue_positions"] = [
+                QueuePosition.from_api(entry) for entry in result.get("queue_positions") or []
+            ]
+        return result
 
-    async def get_order_queue_position(self, order_id: str) -> Dict[str, Any]:
+    async def get_order_queue_position(
+        self,
+        order_id: str,
+        ticker: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get queue position for a specific resting order.
 
+        When the order's market ticker is given, concurrent lookups made within
+        a few milliseconds are coalesced into one get_queue_positions call.
+        Without it, concurrent lookups of the same order share one request.
+
         Args:
             order_id: Order ID to check
+            ticker: Market ticker of the order (enables batching)
 
         Returns:
             Queue position and details
         """
-        return await self._make_authenticated_request(
-            "GET",
-            f"/trade-api/v2/portfolio/orders/{order_id}/queue_position"
-        )
+        if ticker is None:
+            endpoint = _QUEUE_POSITION_PATH % order_id
+            return await self._single_flight(
+                _request_key(endpoint, None),
+                lambda: self._make_authenticated_request("GET", endpoint)
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._qp_pending.append((order_id, ticker, future))
+        if self._qp_flush is None:
+            self._qp_flush = asyncio.create_task(self._flush_queue_positions())
+        return await future
+
+    async def _flush_queue_positions(self) -> None:
+        """Answer all pending queue-position lookups with one batched request."""
+        await asyncio.sleep(self._qp_window)
+        pending, self._qp_pending = self._qp_pending, []
+        self._qp_flush = None
+
+        try:
+            tickers = sorted({ticker for _, ticker, _ in pending})
+            result = await self.get_queue_positions(market_tickers=tickers)
+            positions = {
+                entry.get("order_id"): entry
+                for entry in result.get("queue_positions") or []
+            }
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for order_id, _, future in pending:
+            if future.done():
+                continue
+            entry = positions.get(order_id)
+            if entry is not None:
+                future.set_result({"queue_position": entry.get("queue_position")})
+                continue
+            # Not in the batch (e.g. just filled); ask for this order directly
+            try:
+                future.set_result(await self._make_authenticated_request(
+                    "GET",
+                    _QUEUE_POSITION_PATH % order_id
+                ))
+            except Exception as e:
+                future.set_exception(e)
 
     # ============================================================================
     # EXCHANGE STATUS (Added per Kalshi API docs)
     # ============================================================================
 
+    @_ttl_cached(5, "/trade-api/v2/exchange/status")
     async def get_exchange_status(self) -> Dict[str, Any]:
         """
-        Get current exchange operational status.
+        Get current exchange operational status. Cached for 5 seconds.
 
         Per Kalshi API docs: Check if exchange and trading are active.
 
@@ -2382,9 +3599,10 @@ class KalshiClient(TradingLoggerMixin):
             require_auth=False
         )
 
+    @_ttl_cached(3600, "/trade-api/v2/exchange/schedule")
     async def get_exchange_schedule(self) -> Dict[str, Any]:
         """
-        Get exchange trading schedule.
+        Get exchange trading schedule. Cached for an hour.
 
         Per Kalshi API docs: Returns standard_hours (daily schedule) and
         maintenance_windows (planned downtime).
@@ -2434,13 +3652,211 @@ class KalshiClient(TradingLoggerMixin):
     # Pagination Helpers (per Kalshi Reference: Understanding Pagination)
     # ========================================================================
 
-    async def get_all_markets(
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        max_items: Optional[int] = None,
+        max_concurrency: int = 8
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield items from a cursor-paginated endpoint one at a time.
+
+        Opaque cursors can't be fetched in parallel, but the request for page
+        N+1 is issued as soon as page N's cursor is known and runs while the
+        consumer works through page N. Only one page is held in memory at a
+        time. Numeric offset cursors with a max_items bound are fanned out
+        instead, up to max_concurrency requests at once.
+
+        Args:
+            fetch_page: Coroutine function taking a cursor and returning one page
+            items_key: Response key holding the page items (e.g. 'markets')
+            max_items: Maximum total items to yield (None = unlimited)
+            max_concurrency: Parallel page requests for offset cursors
+        """
+        yielded = 0
+        page_count = 0
+        next_page = asyncio.ensure_future(fetch_page(None))
+
+        try:
+            while next_page is not None:
+                result = await next_page
+                next_page = None
+                page_count += 1
+
+                items = result.get(items_key, [])
+                cursor = result.get('cursor')
+                have_enough = max_items and yielded + len(items) >= max_items
+
+                # Put the next request in flight before handing out this page
+                if cursor and not have_enough:
+                    if page_count == 1 and max_items and _is_offset_cursor(cursor, len(items)):
+                        # Offsets are predictable: fetch all remaining pages at once
+                        next_page = asyncio.ensure_future(self._gather_offset_pages(
+                            fetch_page, items_key, int(cursor), len(items), max_items,
+                            max_concurrency
+                        ))
+                    else:
+                        next_page = asyncio.ensure_future(fetch_page(cursor))
+
+                if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Pagination: fetched page",
+                        page=page_count,
+                        items_key=items_key,
+                        count=len(items),
+                        total=yielded + len(items)
+                    )
+
+                for item in items:
+                    if max_items and yielded >= max_items:
+                        return
+                    yielded += 1
+                    yield item
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    async def _gather_offset_pages(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        start: int,
+        page_size: int,
+        max_items: int,
+        max_concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Fetch pages [start, max_items) concurrently for offset-style cursors.
+
+        Returns:
+            A single merged page with no cursor
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch_page(str(offset))
+
+        pages = await asyncio.gather(*(
+            fetch(offset) for offset in range(start, max_items, page_size)
+        ))
+
+        items: List[Dict[str, Any]] = []
+        for page in pages:
+            page_items = page.get(items_key, [])
+            items.extend(page_items)
+            if len(page_items) < page_size:
+                break
+        return {items_key: items, 'cursor': None}
+
+    async def paginate_all(
+        self,
+        method: Callable[..., Awaitable[Dict[str, Any]]],
+        items_key: str,
+        max_items: Optional[int] = None,
+        max_concurrency: int = 8,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect every item from any cursor-paginated client method.
+
+        Args:
+            method: Bound list method accepting a cursor keyword
+                    (e.g. client.get_milestones)
+            items_key: Response key holding the page items (e.g. 'milestones')
+            max_items: Maximum total items to fetch (None = unlimited)
+            max_concurrency: Parallel page requests when cursors are offsets
+            **kwargs: Filters passed to every page request
+
+        Example:
+            targets = await client.paginate_all(
+                client.get_structured_targets, 'structured_targets',
+                competition="NFL"
+            )
+        """
+        return [
+            item async for item in self._iter_pages(
+                lambda cursor: method(cursor=cursor, **kwargs),
+                items_key,
+                max_items,
+                max_concurrency
+            )
+        ]
+
+    def iter_all_markets(
         self,
         event_ticker: Optional[str] = None,
         series_ticker: Optional[str] = None,
         status: Optional[str] = None,
         max_items: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all markets without materializing the full list.
+
+        Same filters as get_all_markets(). Prefer this for one-pass scans.
+
+        Example:
+            async for market in client.iter_all_markets(status="open"):
+                if market['volume'] > 1000:
+                    ...
+        """
+        return self._iter_pages(
+            lambda cursor: self.get_markets(
+                limit=1000,
+                cursor=cursor,
+                event_ticker=event_ticker,
+                series_ticker=series_ticker,
+                status=status
+            ),
+            'markets',
+            max_items
+        )
+
+    def iter_all_events(
+        self,
+        series_ticker: Optional[str] = None,
+        status: Optional[str] = None,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all events without materializing the full list."""
+        return self._iter_pages(
+            lambda cursor: self.get_events(
+                series_ticker=series_ticker,
+                status=status,
+                limit=200,
+                cursor=cursor
+            ),
+            'events',
+            max_items
+        )
+
+    def iter_all_series(
+        self,
+        tags: Optional[List[str]] = None,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all series without materializing the full list."""
+        # Join once; every page request reuses the string
+        joined_tags = tags and self._join_csv(tags)
+        return self._iter_pages(
+            lambda cursor: self.get_series(
+                limit=100,
+                cursor=cursor,
+                tags=joined_tags
+            ),
+            'series',
+            max_items
+        )
+
+    async def get_all_markets(
+        self,
+        event_ticker: Optional[str] = None,
+        series_ticker: Optional[str] = None,
+        status: Optional[str] = None,
+        max_items: Optional[int] = None,
+        as_dataclass: bool = False
+    ) -> Union[List[Dict[str, Any]], List[MarketSnapshot]]:
         """
         Auto-paginate through all markets.
 
@@ -2452,6 +3868,8 @@ class KalshiClient(TradingLoggerMixin):
             series_ticker: Filter by series ticker
             status: Filter by market status
             max_items: Maximum total items to fetch (None = unlimited)
+            as_dataclass: Return slotted MarketSnapshot objects instead of dicts,
+                          which use a fraction of the memory for large scans
 
         Returns:
             List of all markets
@@ -2463,37 +3881,15 @@ class KalshiClient(TradingLoggerMixin):
                 status="open"
             )
         """
-        all_markets = []
-        cursor = None
-        page_count = 0
-
-        while True:
-            page_count += 1
-            result = await self.get_markets(
-                limit=100,
-                cursor=cursor,
-                event_ticker=event_ticker,
-                series_ticker=series_ticker,
-                status=status
-            )
-
-            markets = result.get('markets', [])
-            all_markets.extend(markets)
-
-            self.logger.debug(
-                f"Pagination: Fetched page {page_count}, "
-                f"{len(markets)} markets, total: {len(all_markets)}"
-            )
-
-            # Check stopping conditions
-            if max_items and len(all_markets) >= max_items:
-                return all_markets[:max_items]
-
-            cursor = result.get('cursor')
-            if not cursor:
-                break
-
-        return all_markets
+        markets = self.iter_all_markets(
+            event_ticker=event_ticker,
+            series_ticker=series_ticker,
+            status=status,
+            max_items=max_items
+        )
+        if as_dataclass:
+            return [MarketSnapshot.from_api(market) async for market in markets]
+        return [market async for market in markets]
 
     async def get_all_events(
         self,
@@ -2512,28 +3908,13 @@ class KalshiClient(TradingLoggerMixin):
         Returns:
             List of all events
         """
-        all_events = []
-        cursor = None
-
-        while True:
-            result = await self.get_events(
+        return [
+            event async for event in self.iter_all_events(
                 series_ticker=series_ticker,
                 status=status,
-                limit=200,
-                cursor=cursor
+                max_items=max_items
             )
-
-            events = result.get('events', [])
-            all_events.extend(events)
-
-            if max_items and len(all_events) >= max_items:
-                return all_events[:max_items]
-
-            cursor = result.get('cursor')
-            if not cursor:
-                break
-
-        return all_events
+        ]
 
     async def get_all_series(
         self,
@@ -2550,27 +3931,64 @@ class KalshiClient(TradingLoggerMixin):
         Returns:
             List of all series
         """
-        all_series = []
-        cursor = None
-
-        while True:
-            result = await self.get_series(
-                limit=100,
-                cursor=cursor,
-                tags=tags
+        return [
+            series async for series in self.iter_all_series(
+                tags=tags,
+                max_items=max_items
             )
+        ]
 
-            series = result.get('series', [])
-            all_series.extend(series)
+    async def fetch_all_milestones(
+        self,
+        max_items: Optional[int] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect every milestone matching the filters, 500 per page (the API max).
 
-            if max_items and len(all_series) >= max_items:
-                return all_series[:max_items]
+        Args:
+            max_items: Maximum total items to fetch (None = unlimited)
+            **filters: Filters accepted by get_milestones()
+        """
+        return await self.paginate_all(
+            self.get_milestones, 'milestones', max_items, limit=500, **filters
+        )
 
-            cursor = result.get('cursor')
-            if not cursor:
-                break
+    async def fetch_all_structured_targets(
+        self,
+        max_items: Optional[int] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect every structured target matching the filters, 2000 per page (the API max).
 
-        return all_series
+        Args:
+            max_items: Maximum total items to fetch (None = unlimited)
+            **filters: Filters accepted by get_structured_targets()
+        """
+        return await self.paginate_all(
+            self.get_structured_targets, 'structured_targets', max_items,
+            page_size=2000, **filters
+        )
+
+    async def fetch_all_fcm_orders(
+        self,
+        subtrader_id: str,
+        max_items: Optional[int] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect every FCM order for a subtrader, 1000 per page (the API max).
+
+        Args:
+            subtrader_id: Subtrader ID (FCM members only)
+            max_items: Maximum total items to fetch (None = unlimited)
+            **filters: Filters accepted by get_fcm_orders()
+        """
+        return await self.paginate_all(
+            self.get_fcm_orders, 'orders', max_items,
+            subtrader_id=subtrader_id, limit=1000, **filters
+        )
 
     # ============================================================================
     # INCENTIVE PROGRAMS (API Part 6)
@@ -2581,7 +3999,8 @@ class KalshiClient(TradingLoggerMixin):
         status: Optional[str] = None,
         incentive_type: Optional[str] = None,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         List incentive programs (rewards for trading activity).
@@ -2596,6 +4015,7 @@ class KalshiClient(TradingLoggerMixin):
                           Default: all
             limit: Number of results per page (1-10000, default 100)
             cursor: Pagination cursor
+            as_dataclass: Return incentive_programs as IncentiveProgram objects
 
         Returns:
             Dict with:
@@ -2617,22 +4037,19 @@ class KalshiClient(TradingLoggerMixin):
                 incentive_type="liquidity"
             )
         """
-        params = {}
-        if status:
-            params["status"] = status
-        if incentive_type:
-            params["type"] = incentive_type
-        if limit:
-            params["limit"] = limit
-        if cursor:
-            params["cursor"] = cursor
-
-        return await self._make_authenticated_request(
-            "GET",
-            "/trade-api/v2/incentive_programs",
-            params=params,
-            require_auth=False
-        )
+        params = _query_params(status=status, type=incentive_type, limit=limit, cursor=cursor)
+
+        result = await self._cached_get(_INCENTIVE_PROGRAMS_PATH, params, ttl=60.0)
+        if as_dataclass:
+            # Build a new page; the cached one is shared
+            return {
+                **result,
+                "incentive_programs": [
+                    IncentiveProgram.from_api(program)
+                    for program in result.get("incentive_programs") or []
+                ]
+            }
+        return result
 
     # ============================================================================
     # FCM ENDPOINTS (API Part 6) - FCM Members Only
@@ -2647,7 +4064,8 @@ class KalshiClient(TradingLoggerMixin):
         min_ts: Optional[int] = None,
         max_ts: Optional[int] = None,
         status: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         Get orders filtered by subtrader ID (FCM members only).
@@ -2663,6 +4081,7 @@ class KalshiClient(TradingLoggerMixin):
             max_ts: Filter orders before this Unix timestamp
             status: Filter by status (resting, canceled, executed)
             limit: Number of results per page (1-1000, default 100)
+            as_dataclass: Return orders as FcmOrder objects
 
         Returns:
             Dict with:
@@ -2679,28 +4098,28 @@ class KalshiClient(TradingLoggerMixin):
         Note:
             This endpoint is only available to FCM members.
         """
-        params = {"subtrader_id": subtrader_id}
-        if cursor:
-            params["cursor"] = cursor
-        if event_ticker:
-            params["event_ticker"] = event_ticker
-        if ticker:
-            params["ticker"] = ticker
-        if min_ts:
-            params["min_ts"] = min_ts
-        if max_ts:
-            params["max_ts"] = max_ts
-        if status:
-            params["status"] = status
-        if limit:
-            params["limit"] = limit
+        params = {
+            "subtrader_id": subtrader_id,
+            **_query_params(
+                cursor=cursor,
+                event_ticker=event_ticker,
+                ticker=ticker,
+                min_ts=min_ts,
+                max_ts=max_ts,
+                status=status,
+                limit=limit
+            )
+        }
 
-        return await self._make_authenticated_request(
+        result = await self._make_authenticated_request(
             "GET",
-            "/trade-api/v2/fcm/orders",
+            _FCM_ORDERS_PATH,
             params=params,
             require_auth=True
         )
+        if as_dataclass:
+            result["orders"] = [FcmOrder.from_api(order) for order in result.get("orders") or []]
+        return result
 
     async def get_fcm_positions(
         self,
@@ -2710,7 +4129,8 @@ class KalshiClient(TradingLoggerMixin):
         count_filter: Optional[str] = None,
         settlement_status: Optional[str] = None,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         Get positions filtered by subtrader ID (FCM members only).
@@ -2726,6 +4146,8 @@ class KalshiClient(TradingLoggerMixin):
                              Default: unsettled
             limit: Number of results per page (1-1000, default 100)
             cursor: Pagination cursor
+            as_dataclass: Return market_positions as FcmPosition objects
+                          (event_positions stay dicts)
 
         Returns:
             Dict with:
@@ -2743,26 +4165,152 @@ class KalshiClient(TradingLoggerMixin):
         Note:
             This endpoint is only available to FCM members.
         """
-        params = {"subtrader_id": subtrader_id}
-        if ticker:
-            params["ticker"] = ticker
-        if event_ticker:
-            params["event_ticker"] = event_ticker
-        if count_filter:
-            params["count_filter"] = count_filter
-        if settlement_status:
-            params["settlement_status"] = settlement_status
-        if limit:
-            params["limit"] = limit
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "subtrader_id": subtrader_id,
+            **_query_params(
+                ticker=ticker,
+                event_ticker=event_ticker,
+                count_filter=count_filter,
+                settlement_status=settlement_status,
+                limit=limit,
+                cursor=cursor
+            )
+        }
 
-        return await self._make_authenticated_request(
+        result = await self._make_authenticated_request(
             "GET",
-            "/trade-api/v2/fcm/positions",
+            _FCM_POSITIONS_PATH,
             params=params,
             require_auth=True
         )
+        if as_dataclass:
+            result["market_positions"] = [
+                FcmPosition.from_api(position) for position in result.get("market_positions") or []
+            ]
+        return result
+
+    def start_fcm_polling(self, subtrader_id: str, interval: float = 1.0) -> None:
+        """
+        Refresh a subtrader's FCM positions and orders in the background.
+
+        Any number of consumers can then read the latest snapshot through
+        fcm_positions_latest / fcm_orders_latest, so the exchange sees one
+        pair of requests per interval however many loops are watching.
+
+        Args:
+            subtrader_id: Subtrader to poll
+            interval: Seconds between refreshes
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.stop_fcm_polling(subtrader_id)
+        self._fcm_pollers[subtrader_id] = asyncio.create_task(
+            self._poll_fcm(subtrader_id, interval)
+        )
+
+    def stop_fcm_polling(self, subtrader_id: str) -> None:
+        """Stop background FCM polling for a subtrader, if running."""
+        task = self._fcm_pollers.pop(subtrader_id, None)
+        if task is not None:
+            task.cancel()
+        self._wake_fcm_readers(
+            subtrader_id, KalshiAPIError(f"FCM polling stopped for subtrader {subtrader_id}")
+        )
+
+    async def fcm_positions_latest(
+        self,
+        subtrader_id: str,
+        wait: bool = False,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Latest polled get_fcm_positions result for a subtrader.
+
+        Args:
+            subtrader_id: Subtrader started with start_fcm_polling
+            wait: Wait for the next refresh instead of returning the cached one
+            timeout: Longest wait for a refresh, in seconds (default _FCM_WAIT_TIMEOUT)
+
+        Raises:
+            KalshiAPIError: If polling isn't running, the refresh failed or was
+                            stopped, or it didn't arrive within the timeout
+        """
+        return await self._fcm_latest_result("positions", subtrader_id, wait, timeout)
+
+    async def fcm_orders_latest(
+        self,
+        subtrader_id: str,
+        wait: bool = False,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Latest polled get_fcm_orders result for a subtrader.
+
+        Args:
+            subtrader_id: Subtrader started with start_fcm_polling
+            wait: Wait for the next refresh instead of returning the cached one
+            timeout: Longest wait for a refresh, in seconds (default _FCM_WAIT_TIMEOUT)
+
+        Raises:
+            KalshiAPIError: If polling isn't running, the refresh failed or was
+                            stopped, or it didn't arrive within the timeout
+        """
+        return await self._fcm_latest_result("orders", subtrader_id, wait, timeout)
+
+    async def _fcm_latest_result(
+        self,
+        kind: str,
+        subtrader_id: str,
+        wait: bool,
+        timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        if subtrader_id not in self._fcm_pollers:
+            raise KalshiAPIError(f"FCM polling is not running for subtrader {subtrader_id}")
+        key = (kind, subtrader_id)
+        if wait or key not in self._fcm_latest:
+            refreshed = self._fcm_refreshed.get(subtrader_id)
+            if refreshed is None:
+                refreshed = self._fcm_refreshed[subtrader_id] = asyncio.get_running_loop().create_future()
+                # Mark a failure as retrieved even if every reader has timed out
+                refreshed.add_done_callback(lambda f: f.cancelled() or f.exception())
+            if timeout is None:
+                timeout = self._FCM_WAIT_TIMEOUT
+            try:
+                # Shielded so one reader timing out doesn't cancel the others' wait
+                await asyncio.wait_for(asyncio.shield(refreshed), timeout)
+            except asyncio.TimeoutError:
+                raise KalshiAPIError(
+                    f"Timed out waiting for FCM refresh of subtrader {subtrader_id}"
+                ) from None
+        return self._fcm_latest[key]
+
+    def _wake_fcm_readers(self, subtrader_id: str, error: Optional[Exception] = None) -> None:
+        """Release readers waiting on a subtrader's next refresh, failing them with ``error``."""
+        refreshed = self._fcm_refreshed.pop(subtrader_id, None)
+        if refreshed is None or refreshed.done():
+            return
+        if error is None:
+            refreshed.set_result(None)
+        else:
+            refreshed.set_exception(error)
+
+    async def _poll_fcm(self, subtrader_id: str, interval: float) -> None:
+        """Fetch positions and orders for a subtrader until cancelled."""
+        while True:
+            try:
+                positions, orders = await asyncio.gather(
+                    self.get_fcm_positions(subtrader_id),
+                    self.get_fcm_orders(subtrader_id)
+                )
+                self._fcm_latest[("positions", subtrader_id)] = positions
+                self._fcm_latest[("orders", subtrader_id)] = orders
+                self._wake_fcm_readers(subtrader_id)
+            except Exception as e:
+                self.logger.warning("FCM poll failed", subtrader_id=subtrader_id, error=str(e))
+                self._wake_fcm_readers(
+                    subtrader_id, KalshiAPIError(f"FCM poll failed for subtrader {subtrader_id}: {e}")
+                )
+            await asyncio.sleep(interval)
 
     # ============================================================================
     # STRUCTURED TARGETS (API Part 6)
@@ -2773,7 +4321,8 @@ class KalshiClient(TradingLoggerMixin):
         target_type: Optional[str] = None,
         competition: Optional[str] = None,
         page_size: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         List structured targets with filtering.
@@ -2785,6 +4334,7 @@ class KalshiClient(TradingLoggerMixin):
             competition: Filter by competition
             page_size: Number of items per page (1-2000, default 100)
             cursor: Pagination cursor
+            as_dataclass: Return structured_targets as StructuredTarget objects
 
         Returns:
             Dict with:
@@ -2804,20 +4354,22 @@ class KalshiClient(TradingLoggerMixin):
                 page_size=50
             )
         """
-        params = {"page_size": page_size}
-        if target_type:
-            params["type"] = target_type
-        if competition:
-            params["competition"] = competition
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "page_size": page_size,
+            **_query_params(type=target_type, competition=competition, cursor=cursor)
+        }
 
-        return await self._make_authenticated_request(
-            "GET",
-            "/trade-api/v2/structured_targets",
-            params=params,
-            require_auth=False
-        )
+        result = await self._cached_get(_STRUCTURED_TARGETS_PATH, params, ttl=300.0)
+        if as_dataclass:
+            # Build a new page; the cached one is shared
+            return {
+                **result,
+                "structured_targets": [
+                    StructuredTarget.from_api(target)
+                    for target in result.get("structured_targets") or []
+                ]
+            }
+        return result
 
     async def get_structured_target(
         self,
@@ -2839,12 +4391,42 @@ class KalshiClient(TradingLoggerMixin):
             target = await client.get_structured_target("target-123")
             print(f"Target: {target['structured_target']['name']}")
         """
-        return await self._make_authenticated_request(
-            "GET",
-            f"/trade-api/v2/structured_targets/{structured_target_id}",
-            require_auth=False
+        return await self._cached_get(_STRUCTURED_TARGET_PATH % structured_target_id, ttl=300.0)
+
+    async def get_structured_targets_by_ids(
+        self,
+        structured_target_ids: List[str],
+        max_concurrency: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several structured targets concurrently.
+
+        Args:
+            structured_target_ids: Structured target IDs
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            One get_structured_target response per ID, in input order
+        """
+        return await self._gather_bounded(
+            self.get_structured_target, structured_target_ids, max_concurrency
         )
 
+    async def _gather_bounded(
+        self,
+        fetch: Callable[[str], Awaitable[Dict[str, Any]]],
+        ids: List[str],
+        max_concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """Run fetch(id) for every ID with at most max_concurrency in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(item_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch(item_id)
+
+        return await asyncio.gather(*(fetch_one(item_id) for item_id in ids))
+
     # ============================================================================
     # MILESTONES (API Part 6)
     # ============================================================================
@@ -2881,11 +4463,27 @@ class KalshiClient(TradingLoggerMixin):
             milestone = await client.get_milestone("milestone-123")
             print(f"Milestone: {milestone['milestone']['title']}")
         """
-        return await self._make_authenticated_request(
-            "GET",
-            f"/trade-api/v2/milestones/{milestone_id}",
-            require_auth=False
-        )
+        return await self._cached_get(_MILESTONE_PATH % milestone_id, ttl=60.0)
+
+    async def get_milestones_by_ids(
+        self,
+        milestone_ids: List[str],
+        max_concurrency: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several milestones concurrently.
+
+        Args:
+            milestone_ids: Milestone IDs
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            One get_milestone response per ID, in input order
+
+        Example:
+            results = await client.get_milestones_by_ids(["m-1", "m-2", "m-3"])
+        """
+        return await self._gather_bounded(self.get_milestone, milestone_ids, max_concurrency)
 
     async def get_milestones(
         self,
@@ -2896,7 +4494,8 @@ class KalshiClient(TradingLoggerMixin):
         source_id: Optional[str] = None,
         milestone_type: Optional[str] = None,
         related_event_ticker: Optional[str] = None,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        as_dataclass: bool = False
     ) -> Dict[str, Any]:
         """
         List milestones with filtering and pagination.
@@ -2912,6 +4511,7 @@ class KalshiClient(TradingLoggerMixin):
             milestone_type: Filter by milestone type
             related_event_ticker: Filter by related event ticker
             cursor: Pagination cursor
+            as_dataclass: Return milestones as Milestone objects
 
         Returns:
             Dict with:
@@ -2929,33 +4529,101 @@ class KalshiClient(TradingLoggerMixin):
         if not 1 <= limit <= 500:
             raise ValueError("limit must be between 1 and 500")
 
-        params = {"limit": limit}
-        if minimum_start_date:
-            params["minimum_start_date"] = minimum_start_date
-        if category:
-            params["category"] = category
-        if competition:
-            params["competition"] = competition
-        if source_id:
-            params["source_id"] = source_id
-        if milestone_type:
-            params["type"] = milestone_type
-        if related_event_ticker:
-            params["related_event_ticker"] = related_event_ticker
-        if cursor:
-            params["cursor"] = cursor
+        params = {
+            "limit": limit,
+            **_query_params(
+                minimum_start_date=minimum_start_date,
+                category=category,
+                competition=competition,
+                source_id=source_id,
+                type=milestone_type,
+                related_event_ticker=related_event_ticker,
+                cursor=cursor
+            )
+        }
 
-        return await self._make_authenticated_request(
-            "GET",
-            "/trade-api/v2/milestones",
-            params=params,
-            require_auth=False
-        )
+        result = await self._cached_get(_MILESTONES_PATH, params, ttl=60.0)
+        if as_dataclass:
+            # Build a new page; the cached one is shared
+            return {
+                **result,
+                "milestones": [
+                    Milestone.from_api(milestone)
+                    for milestone in result.get("milestones") or []
+                ]
+            }
+        return result
+
+    def make_milestone_query(
+        self,
+        limit: int = 500,
+        **filters
+    ) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        """
+        Bind a fixed set of milestone filters once for repeated paging.
+
+        Loops that walk the same category or competition page after page only
+        vary the cursor, so the filters are captured in a partial up front.
+
+        Args:
+            limit: Number of results per page (1-500, default 500)
+            **filters: Filters accepted by get_milestones()
+
+        Returns:
+            Coroutine function accepting the remaining get_milestones() args
+
+        Example:
+            elections = client.make_milestone_query(category="election")
+            page = await elections(cursor=cursor)
+        """
+        if not 1 <= limit <= 500:
+            raise ValueError("limit must be between 1 and 500")
+        return functools.partial(self.get_milestones, limit=limit, **filters)
+
+    async def warm_up(self) -> None:
+        """
+        Open the pooled connection ahead of the first trade.
+
+        Fetches the exchange status so the TLS handshake (and HTTP/2 settings
+        exchange) happens now rather than on the first order. Failures are
+        logged and left for the first real request to surface.
+        """
+        try:
+            await self.get_exchange_status()
+        except KalshiAPIError as e:
+            self.logger.warning("Connection warm-up failed", error=str(e))
+
+    def _abort_batch(
+        self,
+        flush: Optional[asyncio.Task],
+        futures: List[asyncio.Future],
+        what: str
+    ) -> None:
+        """Cancel a micro-batch that hasn't been sent and fail its waiting callers."""
+        if flush is not None:
+            flush.cancel()
+        for future in futures:
+            if not future.done():
+                future.set_exception(KalshiAPIError(f"Client closed before {what} was sent"))
 
     async def close(self) -> None:
         """Close the HTTP client."""
-        await self.client.aclose()
-        self.logger.info("Kalshi client closed")
+        for order_group_id in list(self._group_heartbeats):
+            self.stop_order_group_heartbeat(order_group_id)
+        for subtrader_id in list(self._fcm_pollers):
+            self.stop_fcm_polling(subtrader_id)
+        self._abort_batch(
+            self._qp_flush, [future for _, _, future in self._qp_pending], "queue-position lookup"
+        )
+        self._qp_flush, self._qp_pending = None, []
+        self._abort_batch(
+            self._order_flush, [future for _, future in self._order_pending], "queued order"
+        )
+        self._order_flush, self._order_pending = None, []
+        if self._http_client is not None and not self._http_released:
+            self._http_released = True
+            await _release_shared_http_client(self._http_client, self.base_url, self._http_loop)
+        self.logger.debug("Kalshi client closed")
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -15,15 +15,22 @@ Features:
 import asyncio
 import json
 import websockets
+import numpy as np
 import time
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Tuple
 from urllib.parse import urlparse
 from datetime import datetime
-from collections import deque
 
 from src.config.settings import settings
 from src.utils.logging_setup import get_trading_logger
-from src.clients.kalshi_client import KalshiClient
+from src.clients.kalshi_client import (
+    KalshiClient, KalshiAPIError, WebSocketSendError, _json_dumps, _json_loads
+)
+
+
+def _encode_frame(message: Dict[str, Any]) -> str:
+    """Serialize an outbound command as a compact JSON text frame."""
+    return _json_dumps(message).decode('utf-8')
 
 
 class KalshiWebSocketClient:
@@ -35,9 +42,40 @@ class KalshiWebSocketClient:
     - orderbook_delta: Incremental orderbook changes
     - fill: Your order fills
     - trade: Public trade notifications
+
+    Runs on whichever event loop is active; beast_mode_bot.py installs
+    uvloop before starting when it is available.
+
+    Args:
+        kalshi_client: REST client used for request signing
+        ticker_coalesce_window: Seconds to collect ticker updates and deliver
+            only the newest per market. Off (0) by default; enabling it delays
+            every ticker callback by up to this long, so leave it off for
+            consumers on the trading path.
     """
 
-    def __init__(self, kalshi_client: Optional[KalshiClient] = None):
+    # Tickers per subscribe frame; keeps frames well under server size limits
+    _SUBSCRIBE_BATCH_SIZE = 200
+
+    # Fixed shape of a ticker subscribe frame: %d is the command id and %s the
+    # JSON-encoded ticker array, so no dicts are built per subscribe
+    _TICKER_SUBSCRIBE_FRAME = '{"id":%d,"cmd":"subscribe","params":{"market_tickers":%s}}'
+
+    # Decoded messages buffered for callbacks before market data is dropped
+    _DISPATCH_QUEUE_SIZE = 10_000
+
+    # Account channels that are never dropped; a full queue makes the reader
+    # wait for the callback worker instead
+    _LOSSLESS_CHANNELS = frozenset(('fill', 'market_positions'))
+
+    # Seconds disconnect() waits for queued callbacks before cancelling them
+    _DISPATCH_DRAIN_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        kalshi_client: Optional[KalshiClient] = None,
+        ticker_coalesce_window: float = 0.0
+    ):
         self.kalshi_client = kalshi_client or KalshiClient()
         self.logger = get_trading_logger("kalshi_websocket")
 
@@ -46,18 +84,22 @@ class KalshiWebSocketClient:
         self.is_connected = False
         self.should_reconnect = True
 
-        # Callbacks for different message types
+        # Callbacks for different message types, split into plain functions
+        # and coroutine functions when registered
         self.callbacks = {
-            'ticker': [],
-            'orderbook_snapshot': [],
-            'orderbook_delta': [],
-            'fill': [],
-            'trade': [],
-            'market_positions': [],
-            'market_lifecycle_v2': [],
-            'event_lifecycle': [],
-            'multivariate': [],
-            'communications': []
+            channel: {'sync': [], 'async': []}
+            for channel in (
+                'ticker',
+                'orderbook_snapshot',
+                'orderbook_delta',
+                'fill',
+                'trade',
+                'market_positions',
+                'market_lifecycle_v2',
+                'event_lifecycle',
+                'multivariate',
+                'communications'
+            )
         }
 
         # Subscribed tickers
@@ -68,15 +110,27 @@ class KalshiWebSocketClient:
         # Connection management
         self.reconnect_delay = 1  # Start with 1 second
         self.max_reconnect_delay = 60  # Max 60 seconds
-        self.last_message_time = time.time()
+        self.last_message_time = time.monotonic()  # Event loop clock
         self.heartbeat_interval = 10  # Ping every 10 seconds
 
-        # Message queue for processing
-        self.message_queue = asyncio.Queue()
-
         # Message ID tracking for WebSocket commands (per Quick Start docs)
         self._message_id = 1
 
+        # Futures awaiting a response frame, keyed by command id
+        self._pending_commands: Dict[int, asyncio.Future] = {}
+
+        # Receive loop hands (channel, data) to a single callback worker so a
+        # slow callback never stalls reads from the socket
+        self._dispatch_queue: asyncio.Queue = asyncio.Queue(maxsize=self._DISPATCH_QUEUE_SIZE)
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self.dropped_messages = 0
+
+        # Opt-in: ticker updates within one window are coalesced to the
+        # latest per market before callbacks see them
+        self._ticker_window = ticker_coalesce_window
+        self._ticker_pending: Dict[str, Dict[str, Any]] = {}
+        self._ticker_flush: Optional[asyncio.Task] = None
+
     async def connect(self):
         """
         Connect to Kalshi WebSocket with authentication.
@@ -99,7 +153,7 @@ class KalshiWebSocketClient:
             connection_errors = []
 
             for signing_path in signing_paths:
-                timestamp = str(int(time.time() * 1000))
+                timestamp = str(time.time_ns() // 1_000_000)
                 signature = self.kalshi_client._sign_request(timestamp, "GET", signing_path)
                 headers = {
                     "KALSHI-ACCESS-KEY": self.kalshi_client.api_key,
@@ -128,7 +182,7 @@ class KalshiWebSocketClient:
                     )
                     self.is_connected = True
                     self.reconnect_delay = 1  # Reset backoff on successful connection
-                    self.last_message_time = time.time()
+                    self.last_message_time = asyncio.get_running_loop().time()
 
                     self.logger.info("✅ WebSocket connected successfully")
 
@@ -161,7 +215,7 @@ class KalshiWebSocketClient:
                 )
                 self.is_connected = True
                 self.reconnect_delay = 1
-                self.last_message_time = time.time()
+                self.last_message_time = asyncio.get_running_loop().time()
                 self.logger.info("✅ WebSocket connected successfully (api-key only)")
                 if self.subscribed_tickers:
                     await self._resubscribe_all()
@@ -186,6 +240,26 @@ class KalshiWebSocketClient:
         if self.websocket:
             await self.websocket.close()
         self.is_connected = False
+
+        # Deliver coalesced ticker updates instead of dropping them
+        if self._ticker_flush is not None:
+            self._ticker_flush.cancel()
+            self._ticker_flush = None
+        pending, self._ticker_pending = self._ticker_pending, {}
+        for data in pending.values():
+            self._enqueue_dispatch('ticker', data)
+
+        if self._dispatch_task is not None:
+            # A callback calling disconnect() runs on the worker; don't wait on itself
+            if not self._dispatch_queue.empty() and self._dispatch_task is not asyncio.current_task():
+                try:
+                    await asyncio.wait_for(self._dispatch_queue.join(), self._DISPATCH_DRAIN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        f"Dropping {self._dispatch_queue.qsize()} queued messages on disconnect"
+                    )
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
         self.logger.info("WebSocket disconnected")
 
     async def subscribe_ticker(self, ticker: str):
@@ -195,28 +269,43 @@ class KalshiWebSocketClient:
         Args:
             ticker: Market ticker (e.g., "PRES-TRUMP-2024")
         """
+        return await self.subscribe_tickers([ticker])
+
+    async def subscribe_tickers(self, tickers: list):
+        """
+        Subscribe to real-time price updates for many tickers at once.
+
+        Prefer this over repeated subscribe_ticker calls: tickers are sent
+        in frames of up to _SUBSCRIBE_BATCH_SIZE instead of one per ticker.
+
+        Args:
+            tickers: Market tickers to subscribe to
+        """
         if not self.is_connected:
             self.logger.warning("Cannot subscribe: WebSocket not connected")
             return False
 
+        tickers = list(dict.fromkeys(tickers))
         try:
-            # Per Kalshi Quick Start docs: include "id" field for message tracking
-            message = {
-                "id": self._message_id,
-                "cmd": "subscribe",
-                "params": {
-                    "market_tickers": [ticker]
-                }
-            }
-            self._message_id += 1
+            for start in range(0, len(tickers), self._SUBSCRIBE_BATCH_SIZE):
+                batch = tickers[start:start + self._SUBSCRIBE_BATCH_SIZE]
+                # Per Kalshi Quick Start docs: include "id" field for message tracking
+                frame = self._TICKER_SUBSCRIBE_FRAME % (
+                    self._message_id, _json_dumps(batch).decode('utf-8')
+                )
+                self._message_id += 1
 
-            await self.websocket.send(json.dumps(message))
-            self.subscribed_tickers.add(ticker)
-            self.logger.info(f"📊 Subscribed to ticker: {ticker}")
+                await self.websocket.send(frame)
+                self.subscribed_tickers.update(batch)
+
+            if len(tickers) == 1:
+                self.logger.info(f"📊 Subscribed to ticker: {tickers[0]}")
+            else:
+                self.logger.info(f"📊 Subscribed to {len(tickers)} tickers")
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to subscribe to {ticker}: {e}")
+            self.logger.error(f"Failed to subscribe to tickers: {e}")
             return False
 
     async def subscribe_fills(self):
@@ -238,7 +327,7 @@ class KalshiWebSocketClient:
             }
             self._message_id += 1
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("🔔 Subscribed to fill notifications")
             return True
 
@@ -265,7 +354,7 @@ class KalshiWebSocketClient:
             }
             self._message_id += 1
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info(f"📖 Subscribed to orderbook: {ticker}")
             return True
 
@@ -297,7 +386,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"]["market_tickers"] = tickers
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("💼 Subscribed to market positions")
             return True
 
@@ -329,7 +418,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"]["market_tickers"] = tickers
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("🔄 Subscribed to market lifecycle")
             return True
 
@@ -355,7 +444,7 @@ class KalshiWebSocketClient:
             }
             self._message_id += 1
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("💬 Subscribed to communications (RFQ/quotes)")
             return True
 
@@ -386,7 +475,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"]["market_tickers"] = tickers
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("📈 Subscribed to public trades")
             return True
 
@@ -410,7 +499,7 @@ class KalshiWebSocketClient:
             }
             self._message_id += 1
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("📋 Requested subscription list")
             return True
 
@@ -443,7 +532,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"]["market_tickers"] = tickers
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info(f"🚫 Unsubscribed from: {', '.join(channels)}")
             return True
 
@@ -451,13 +540,66 @@ class KalshiWebSocketClient:
             self.logger.error(f"Failed to unsubscribe: {e}")
             return False
 
+    async def send_command(
+        self,
+        cmd: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 5.0
+    ) -> Dict[str, Any]:
+        """
+        Send a command frame and wait for the response with the same id.
+
+        Args:
+            cmd: Command name
+            params: Command parameters
+            timeout: Seconds to wait for the response frame
+
+        Returns:
+            The response "msg" payload (or the whole frame if absent)
+
+        Raises:
+            WebSocketSendError: If the frame could not be sent at all
+            KalshiAPIError: If the server answers with an error frame
+            asyncio.TimeoutError: If no response arrives in time
+        """
+        if not self.is_connected or self.websocket is None:
+            raise WebSocketSendError("WebSocket not connected")
+
+        msg_id = self._message_id
+        self._message_id += 1
+        message = {"id": msg_id, "cmd": cmd}
+        if params is not None:
+            message["params"] = params
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_commands[msg_id] = future
+        try:
+            try:
+                await self.websocket.send(_encode_frame(message))
+            except Exception as e:
+                raise WebSocketSendError(f"Failed to send {cmd}: {e}") from e
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending_commands.pop(msg_id, None)
+
+    def _resolve_command(self, message: Dict[str, Any]) -> None:
+        """Complete the future waiting on this frame's id, if any."""
+        future = self._pending_commands.pop(message.get('id'), None)
+        if future is None or future.done():
+            return
+        if message.get('type') == 'error':
+            error_data = message.get('msg', {})
+            future.set_exception(KalshiAPIError(
+                f"WebSocket command rejected: {error_data.get('code', 'unknown')} "
+                f"{error_data.get('msg', message)}"
+            ))
+        else:
+            future.set_result(message.get('msg', message))
+
     async def _resubscribe_all(self):
         """Resubscribe to all channels after reconnection."""
         self.logger.info(f"Resubscribing to {len(self.subscribed_tickers)} tickers...")
-
-        for ticker in self.subscribed_tickers:
-            await self.subscribe_ticker(ticker)
-            await asyncio.sleep(0.1)  # Avoid overwhelming the server
+        await self.subscribe_tickers(list(self.subscribed_tickers))
 
     async def subscribe_trades(self, tickers: Optional[list[str]] = None):
         """Subscribe to public trade notifications."""
@@ -472,7 +614,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"] = {"market_tickers": tickers}
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("📈 Subscribed to public trades")
             return True
         except Exception as e:
@@ -492,7 +634,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"] = {"market_tickers": tickers}
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("📊 Subscribed to market positions")
             return True
         except Exception as e:
@@ -512,7 +654,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"] = {"market_tickers": tickers}
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("🧬 Subscribed to market lifecycle")
             return True
         except Exception as e:
@@ -532,7 +674,7 @@ class KalshiWebSocketClient:
             if tickers:
                 message["params"] = {"market_tickers": tickers}
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("🧩 Subscribed to multivariate updates")
             return True
         except Exception as e:
@@ -550,7 +692,7 @@ class KalshiWebSocketClient:
                 "channel": "communications"
             }
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("📨 Subscribed to communications")
             return True
         except Exception as e:
@@ -573,7 +715,7 @@ class KalshiWebSocketClient:
             elif tickers:
                 message["params"] = {"market_tickers": tickers}
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info(f"📴 Unsubscribed from {channel}")
             return True
         except Exception as e:
@@ -593,7 +735,7 @@ class KalshiWebSocketClient:
             message = {
                 "type": "list_subscriptions"
             }
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("📋 Requested subscription list")
             return True
         except Exception as e:
@@ -617,7 +759,7 @@ class KalshiWebSocketClient:
             elif channel in self.subscription_ids:
                 message["sid"] = self.subscription_ids[channel]
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info(f"➕ Added markets to {channel} subscription")
             return True
         except Exception as e:
@@ -641,7 +783,7 @@ class KalshiWebSocketClient:
             elif channel in self.subscription_ids:
                 message["sid"] = self.subscription_ids[channel]
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info(f"➖ Removed markets from {channel} subscription")
             return True
         except Exception as e:
@@ -661,59 +803,73 @@ class KalshiWebSocketClient:
             if channel:
                 message["channel"] = channel
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_encode_frame(message))
             self.logger.info("🔁 Updated subscription by sid")
             return True
         except Exception as e:
             self.logger.error(f"Failed to update subscription by sid: {e}")
             return False
 
+    def _register_callback(self, channel: str, callback: Callable) -> None:
+        """Add a callback to the sync or async list for ``channel``."""
+        kind = 'async' if asyncio.iscoroutinefunction(callback) else 'sync'
+        self.callbacks[channel][kind].append(callback)
+
     def on_ticker_update(self, callback: Callable):
         """Register callback for ticker updates."""
-        self.callbacks['ticker'].append(callback)
+        self._register_callback('ticker', callback)
 
     def on_fill(self, callback: Callable):
         """Register callback for fill notifications."""
-        self.callbacks['fill'].append(callback)
+        self._register_callback('fill', callback)
 
     def on_orderbook_update(self, callback: Callable):
         """Register callback for orderbook updates."""
-        self.callbacks['orderbook_delta'].append(callback)
+        self._register_callback('orderbook_delta', callback)
 
     def on_orderbook_snapshot(self, callback: Callable):
         """Register callback for orderbook snapshot updates."""
-        self.callbacks['orderbook_snapshot'].append(callback)
+        self._register_callback('orderbook_snapshot', callback)
 
     def on_trade(self, callback: Callable):
         """Register callback for trade notifications."""
-        self.callbacks['trade'].append(callback)
+        self._register_callback('trade', callback)
 
     def on_market_positions(self, callback: Callable):
         """Register callback for market position updates."""
-        self.callbacks['market_positions'].append(callback)
+        self._register_callback('market_positions', callback)
 
     def on_market_lifecycle(self, callback: Callable):
         """Register callback for market lifecycle updates."""
-        self.callbacks['market_lifecycle_v2'].append(callback)
+        self._register_callback('market_lifecycle_v2', callback)
 
     def on_event_lifecycle(self, callback: Callable):
         """Register callback for event lifecycle updates."""
-        self.callbacks['event_lifecycle'].append(callback)
+        self._register_callback('event_lifecycle', callback)
 
     def on_multivariate(self, callback: Callable):
         """Register callback for multivariate updates."""
-        self.callbacks['multivariate'].append(callback)
+        self._register_callback('multivariate', callback)
 
     def on_communications(self, callback: Callable):
         """Register callback for communications updates."""
-        self.callbacks['communications'].append(callback)
+        self._register_callback('communications', callback)
 
-    async def _process_message(self, message: Dict[str, Any]):
-        """Process incoming WebSocket message."""
+    async def _process_message(self, message: Dict[str, Any], received_at: Optional[float] = None):
+        """
+        Process incoming WebSocket message.
+
+        Args:
+            message: Decoded frame
+            received_at: Event loop time the frame arrived; read from the loop if omitted
+        """
         try:
             msg_type = message.get('type')
             channel = message.get('channel')
 
+            if self._pending_commands and message.get('id') in self._pending_commands:
+                self._resolve_command(message)
+
             if msg_type == 'error':
                 # Per Kalshi Quick Start docs, error format is:
                 # {"id": 123, "type": "error", "msg": {"code": 6, "msg": "Params required"}}
@@ -759,25 +915,95 @@ class KalshiWebSocketClient:
                     if ticker:
                         self.orderbook_snapshots.add(ticker)
 
-                for callback in self.callbacks[effective_channel]:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(data)
-                        else:
-                            callback(data)
-                    except Exception as e:
-                        self.logger.error(f"Callback error for {effective_channel}: {e}")
-
-            self.last_message_time = time.time()
+                callbacks = self.callbacks[effective_channel]
+                if callbacks['sync'] or callbacks['async']:
+                    if effective_channel == 'ticker' and self._ticker_window > 0:
+                        self._coalesce_ticker(data)
+                    elif effective_channel in self._LOSSLESS_CHANNELS:
+                        await self._dispatch_queue.put((effective_channel, data))
+                    else:
+                        self._enqueue_dispatch(effective_channel, data)
+
+            self.last_message_time = (
+                received_at if received_at is not None else asyncio.get_running_loop().time()
+            )
 
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
 
+    def _enqueue_dispatch(self, channel: str, data: Dict[str, Any]) -> None:
+        """Hand a market data message to the callback worker, dropping it if the queue is full."""
+        try:
+            self._dispatch_queue.put_nowait((channel, data))
+        except asyncio.QueueFull:
+            self.dropped_messages += 1
+            # First drop, then every 1000th, so a stalled worker is visible without flooding logs
+            if self.dropped_messages % 1000 == 1:
+                self.logger.warning(
+                    f"Callback queue full, dropped {channel} message "
+                    f"({self.dropped_messages} dropped so far)"
+                )
+
+    def _coalesce_ticker(self, data: Dict[str, Any]) -> None:
+        """Keep only the newest ticker update per market until the next flush."""
+        ticker = data.get('market_ticker') or data.get('ticker')
+        if not ticker:
+            self._enqueue_dispatch('ticker', data)
+            return
+        self._ticker_pending[ticker] = data
+        if self._ticker_flush is None:
+            self._ticker_flush = asyncio.create_task(self._flush_tickers())
+
+    async def _flush_tickers(self) -> None:
+        """Dispatch the latest update for each market seen in the window."""
+        await asyncio.sleep(self._ticker_window)
+        pending, self._ticker_pending = self._ticker_pending, {}
+        self._ticker_flush = None
+        for data in pending.values():
+            self._enqueue_dispatch('ticker', data)
+
+    def _ensure_dispatch_worker(self) -> None:
+        """Start the callback worker if it is not already running."""
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_worker())
+
+    async def _dispatch_worker(self):
+        """
+        Drain the dispatch queue in arrival order.
+
+        For each message, sync callbacks run first in registration order,
+        then all async callbacks run concurrently.
+        """
+        while True:
+            channel, data = await self._dispatch_queue.get()
+            try:
+                callbacks = self.callbacks[channel]
+                for callback in callbacks['sync']:
+                    try:
+                        callback(data)
+                    except Exception as e:
+                        self.logger.error(f"Callback error for {channel}: {e}")
+
+                if callbacks['async']:
+                    results = await asyncio.gather(
+                        *(callback(data) for callback in callbacks['async']),
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            self.logger.error(f"Callback error for {channel}: {result}")
+            except Exception as e:
+                self.logger.error(f"Callback dispatch error for {channel}: {e}")
+            finally:
+                self._dispatch_queue.task_done()
+
     async def listen(self):
         """
         Main listen loop - processes incoming WebSocket messages.
         Handles reconnection with exponential backoff.
         """
+        self._ensure_dispatch_worker()
+        loop = asyncio.get_running_loop()
         while self.should_reconnect:
             try:
                 if not self.is_connected:
@@ -787,16 +1013,19 @@ class KalshiWebSocketClient:
                         self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
                         continue
 
-                # Listen for messages
-                async for message_str in self.websocket:
+                # Listen for messages; frames stay as bytes since the JSON
+                # parser reads UTF-8 directly
+                while True:
+                    frame = await self.websocket.recv(decode=False)
+                    received_at = loop.time()
                     try:
-                        message = json.loads(message_str)
+                        message = _json_loads(frame)
                         if message.get('channel') == 'orderbook_delta':
                             ticker = message.get('data', {}).get('ticker') or message.get('data', {}).get('market_ticker')
                             if ticker and ticker not in self.orderbook_snapshots:
                                 self.logger.debug("Skipping orderbook delta before snapshot", ticker=ticker)
                                 continue
-                        await self._process_message(message)
+                        await self._process_message(message, received_at)
                     except json.JSONDecodeError as e:
                         self.logger.error(f"Invalid JSON received: {e}")
                     except Exception as e:
@@ -819,7 +1048,7 @@ class KalshiWebSocketClient:
             await asyncio.sleep(60)  # Check every minute
 
             if self.is_connected:
-                time_since_message = time.time() - self.last_message_time
+                time_since_message = asyncio.get_running_loop().time() - self.last_message_time
 
                 if time_since_message > 120:  # No messages for 2 minutes
                     self.logger.warning("No messages received for 2 minutes, reconnecting...")
@@ -863,86 +1092,176 @@ async def create_websocket_client(kalshi_client: Optional[KalshiClient] = None)
     return client
 
 
+class KalshiWsTrader:
+    """
+    Order-entry transport that multiplexes order actions over the already-open
+    Kalshi WebSocket instead of paying a full HTTP request per call.
+
+    Attach to a KalshiClient with ``client.attach_ws_trader(trader)``; the
+    client routes amend/decrease/cancel/place through it while connected and
+    falls back to HTTP only when the frame cannot be sent. Rejections and
+    failures after sending raise instead, since the action may have applied.
+
+    Usage:
+        ws = await create_websocket_client(client)
+        client.attach_ws_trader(KalshiWsTrader(ws))
+    """
+
+    def __init__(self, ws_client: KalshiWebSocketClient, timeout: float = 5.0):
+        self.ws_client = ws_client
+        self.timeout = timeout
+
+    @property
+    def available(self) -> bool:
+        """Whether the underlying WebSocket can currently carry commands."""
+        return self.ws_client.is_connected
+
+    async def call(self, cmd: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one order command and return the server response."""
+        return await self.ws_client.send_command(cmd, params, timeout=self.timeout)
+
+
+class _PriceRing:
+    """
+    Fixed-size ring of price updates stored column-wise.
+
+    Timestamps (float64) and yes/no prices (float32) live in parallel NumPy
+    arrays written in place, so a ticker costs a few KB instead of a deque of
+    tuples. Updates are appended in time order, so each of the two runs
+    either side of ``head`` is sorted and can be binary searched.
+    """
+
+    __slots__ = ("ts", "prices", "head", "count")
+
+    def __init__(self, capacity: int):
+        self.ts = np.empty(capacity, dtype=np.float64)
+        self.prices = {
+            'yes': np.empty(capacity, dtype=np.float32),
+            'no': np.empty(capacity, dtype=np.float32)
+        }
+        self.head = 0
+        self.count = 0
+
+    def append(self, timestamp: float, yes_price: float, no_price: float) -> None:
+        """Write one update over the oldest slot once the ring is full."""
+        slot = self.head
+        self.ts[slot] = timestamp
+        self.prices['yes'][slot] = yes_price
+        self.prices['no'][slot] = no_price
+        self.head = (slot + 1) % len(self.ts)
+        self.count = min(self.count + 1, len(self.ts))
+
+    def window(self, side: str, cutoff: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and ``side`` prices written at or after ``cutoff``, oldest first."""
+        prices = self.prices[side]
+        head = self.head
+        if self.count < len(self.ts) or head == 0:
+            # Not wrapped yet (or wrapped exactly): one sorted run
+            end = self.count
+            start = int(np.searchsorted(self.ts[:end], cutoff))
+            return self.ts[start:end], prices[start:end]
+
+        # Oldest run is [head:], newest is [:head]
+        start = int(np.searchsorted(self.ts[head:], cutoff))
+        if start == len(self.ts) - head:
+            start = int(np.searchsorted(self.ts[:head], cutoff))
+            return self.ts[start:head], prices[start:head]
+        start += head
+        return (
+            np.concatenate((self.ts[start:], self.ts[:head])),
+            np.concatenate((prices[start:], prices[:head]))
+        )
+
+    def latest(self, side: str) -> float:
+        """Most recently written price for ``side``."""
+        return float(self.prices[side][self.head - 1])
+
+
 class PriceUpdateAggregator:
     """
     Aggregates WebSocket price updates for trading decisions.
     Provides smoothed prices and detects rapid movements.
     """
 
+    # Updates kept per ticker; older entries are overwritten in place
+    _HISTORY_SIZE = 100
+
     def __init__(self, window_seconds: int = 30):
         self.window_seconds = window_seconds
-        self.price_history = {}  # ticker -> deque of (timestamp, price)
+        self.price_history: Dict[str, _PriceRing] = {}
         self.logger = get_trading_logger("price_aggregator")
 
-    def add_price_update(self, ticker: str, yes_price: float, no_price: float):
-        """Add a price update to history."""
-        if ticker not in self.price_history:
-            self.price_history[ticker] = {
-                'yes': deque(maxlen=100),
-                'no': deque(maxlen=100)
-            }
-
-        now = time.time()
-        self.price_history[ticker]['yes'].append((now, yes_price))
-        self.price_history[ticker]['no'].append((now, no_price))
+    def add_price_update(
+        self,
+        ticker: str,
+        yes_price: float,
+        no_price: float,
+        timestamp: Optional[float] = None
+    ):
+        """
+        Add a price update to history.
 
-    def get_smoothed_price(self, ticker: str, side: str = 'yes') -> Optional[float]:
+        Args:
+            timestamp: Monotonic receive time (e.g. the WebSocket client's
+                last_message_time); defaults to now
+        """
+        history = self.price_history.get(ticker)
+        if history is None:
+            history = self.price_history[ticker] = _PriceRing(self._HISTORY_SIZE)
+        history.append(time.monotonic() if timestamp is None else timestamp, yes_price, no_price)
+
+    def get_smoothed_price(
+        self,
+        ticker: str,
+        side: str = 'yes',
+        now: Optional[float] = None
+    ) -> Optional[float]:
         """
         Get time-weighted average price over the window.
-        More recent prices have more weight.
+        More recent prices have more weight. Pass ``now`` to reuse a
+        timestamp already taken for this tick.
         """
-        if ticker not in self.price_history:
-            return None
-
-        history = self.price_history[ticker][side.lower()]
-        if not history:
+        history = self.price_history.get(ticker)
+        if history is None or not history.count:
             return None
 
-        now = time.time()
-        cutoff_time = now - self.window_seconds
-
-        # Filter to window and calculate weighted average
-        total_weight = 0
-        weighted_sum = 0
-
-        for timestamp, price in history:
-            if timestamp >= cutoff_time:
-                # More recent = more weight (exponential)
-                age = now - timestamp
-                weight = 1.0 / (1.0 + age / 10.0)  # Decay over 10 seconds
-                weighted_sum += price * weight
-                total_weight += weight
+        side = side.lower()
+        now = time.monotonic() if now is None else now
+        timestamps, prices = history.window(side, now - self.window_seconds)
 
-        if total_weight > 0:
-            return weighted_sum / total_weight
+        if prices.size:
+            # More recent = more weight, decaying over 10 seconds
+            weights = 1.0 / (1.0 + (now - timestamps) / 10.0)
+            return float(np.dot(prices, weights) / weights.sum())
 
-        return history[-1][1]  # Latest price if no weighted average
+        return history.latest(side)  # Latest price if no weighted average
 
-    def detect_rapid_movement(self, ticker: str, side: str = 'yes', threshold: float = 0.05) -> bool:
+    def detect_rapid_movement(
+        self,
+        ticker: str,
+        side: str = 'yes',
+        threshold: float = 0.05,
+        now: Optional[float] = None
+    ) -> bool:
         """
         Detect if price moved rapidly (>5% in 30 seconds).
-        Useful for catching momentum or avoiding volatility.
+        Useful for catching momentum or avoiding volatility. Pass ``now``
+        to reuse a timestamp already taken for this tick.
         """
-        if ticker not in self.price_history:
+        history = self.price_history.get(ticker)
+        if history is None or history.count < 2:
             return False
 
-        history = self.price_history[ticker][side.lower()]
-        if len(history) < 2:
-            return False
-
-        now = time.time()
-        cutoff_time = now - self.window_seconds
-
-        prices_in_window = [p for t, p in history if t >= cutoff_time]
+        cutoff_time = (time.monotonic() if now is None else now) - self.window_seconds
+        _, prices_in_window = history.window(side.lower(), cutoff_time)
 
-        if len(prices_in_window) < 2:
+        if prices_in_window.size < 2:
             return False
 
-        price_min = min(prices_in_window)
-        price_max = max(prices_in_window)
+        price_min = prices_in_window.min()
 
         if price_min > 0:
-            move_pct = (price_max - price_min) / price_min
-            return move_pct >= threshold
+            move_pct = np.ptp(prices_in_window) / price_min
+            return bool(move_pct >= threshold)
 
         return False
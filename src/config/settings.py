@@ -34,6 +34,9 @@ class APIConfig:
     )
     kalshi_private_key_pem: str = field(default_factory=lambda: os.getenv("KALSHI_PRIVATE_KEY", ""))
     kalshi_private_key_b64: str = field(default_factory=lambda: os.getenv("KALSHI_PRIVATE_KEY_B64", ""))
+    # Client-side request budget; defaults match Kalshi's Basic tier
+    kalshi_read_rate_limit: float = field(default_factory=lambda: float(os.getenv("KALSHI_READ_RATE_LIMIT", "20")))
+    kalshi_write_rate_limit: float = field(default_factory=lambda: float(os.getenv("KALSHI_WRITE_RATE_LIMIT", "10")))
     openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
     xai_api_key: str = field(default_factory=lambda: os.getenv("XAI_API_KEY", ""))
     openai_base_url: str = "https://api.openai.com/v1"
@@ -67,7 +67,9 @@ async def run_trading_job(
         
         # Initialize clients
         db_manager = db_manager or DatabaseManager()
-        kalshi_client = kalshi_client or KalshiClient()
+        if kalshi_client is None:
+            kalshi_client = KalshiClient()
+            await kalshi_client.warm_up()
         xai_client = xai_client or XAIClient(db_manager=db_manager)  # Pass db_manager for LLM logging
         
         # Configure the unified system
@@ -0,0 +1,1263 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from src.clients.kalshi_client import (
+    KalshiClient, KalshiAPIError, MarketSnapshot, QueuePosition, WebSocketSendError
+)
+
+# Mark all tests in this file as async
+pytestmark = pytest.mark.asyncio
+
+
+class FakeWsTrader:
+    """Stand-in for KalshiWsTrader that records commands."""
+
+    def __init__(self, available=True, response=None, error=None):
+        self.available = available
+        self.response = response if response is not None else {"order": {"order_id": "ws-1"}}
+        self.error = error
+        self.calls = []
+
+    async def call(self, cmd, params):
+        self.calls.append((cmd, params))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+async def test_amend_order_routes_over_websocket_when_attached():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={"order": {}})
+    trader = FakeWsTrader()
+    client.attach_ws_trader(trader)
+
+    result = await client.amend_order(
+        order_id="order-1",
+        ticker="MKT",
+        side="yes",
+        action="buy",
+        client_order_id="a",
+        updated_client_order_id="b",
+        yes_price=55,
+    )
+
+    assert result == trader.response
+    assert trader.calls[0][0] == "amend_order"
+    assert trader.calls[0][1]["order_id"] == "order-1"
+    client._make_authenticated_request.assert_not_called()
+    await client.close()
+
+
+async def test_decrease_order_falls_back_to_http_when_frame_not_sent():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={"order": {"order_id": "http"}})
+    client.attach_ws_trader(FakeWsTrader(error=WebSocketSendError("WebSocket not connected")))
+
+    result = await client.decrease_order("order-1", reduce_by=2)
+
+    assert result == {"order": {"order_id": "http"}}
+    client._make_authenticated_request.assert_awaited_once()
+    await client.close()
+
+
+@pytest.mark.parametrize("error", [KalshiAPIError("insufficient balance"), ConnectionResetError("drop")])
+async def test_ws_rejection_or_failure_after_send_does_not_fall_back(error):
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock()
+    client.attach_ws_trader(FakeWsTrader(error=error))
+
+    with pytest.raises(KalshiAPIError):
+        await client.cancel_order("order-1")
+    client._make_authenticated_request.assert_not_called()
+    await client.close()
+
+
+async def test_ws_timeout_does_not_fall_back():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock()
+    client.attach_ws_trader(FakeWsTrader(error=asyncio.TimeoutError()))
+
+    with pytest.raises(KalshiAPIError):
+        await client.cancel_order("order-1")
+    client._make_authenticated_request.assert_not_called()
+    await client.close()
+
+
+async def test_unavailable_ws_trader_uses_http():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+    trader = FakeWsTrader(available=False)
+    client.attach_ws_trader(trader)
+
+    await client.cancel_order("order-1")
+
+    assert trader.calls == []
+    client._make_authenticated_request.assert_awaited_once()
+    await client.close()
+
+
+async def test_get_all_markets_prefetches_and_preserves_order():
+    client = KalshiClient(api_key="test-key")
+    pages = {
+        None: {"markets": [{"ticker": "A"}, {"ticker": "B"}], "cursor": "c1"},
+        "c1": {"markets": [{"ticker": "C"}], "cursor": "c2"},
+        "c2": {"markets": [{"ticker": "D"}], "cursor": ""},
+    }
+    requested = []
+
+    async def fake_get_markets(cursor=None, **kwargs):
+        requested.append(cursor)
+        return pages[cursor]
+
+    client.get_markets = fake_get_markets
+
+    markets = await client.get_all_markets(status="open")
+
+    assert [m["ticker"] for m in markets] == ["A", "B", "C", "D"]
+    assert requested == [None, "c1", "c2"]
+    await client.close()
+
+
+async def test_get_all_markets_stops_prefetching_at_max_items():
+    client = KalshiClient(api_key="test-key")
+    requested = []
+
+    async def fake_get_markets(cursor=None, **kwargs):
+        requested.append(cursor)
+        return {"markets": [{"ticker": f"{cursor}-{i}"} for i in range(3)], "cursor": "next"}
+
+    client.get_markets = fake_get_markets
+
+    markets = await client.get_all_markets(max_items=5)
+
+    assert len(markets) == 5
+    assert requested == [None, "next"]
+    await client.close()
+
+
+def _response(status_code, content=b"", headers=None):
+    request = httpx.Request("GET", "https://api.elections.kalshi.com/trade-api/v2/markets")
+    return httpx.Response(status_code, content=content, headers=headers, request=request)
+
+
+def _skip_health_tracking(monkeypatch):
+    """Keep failed requests from writing to logs/health_state.json."""
+    monkeypatch.setattr("src.clients.kalshi_client.record_failure", lambda *args, **kwargs: None)
+
+
+async def test_request_serializes_body_and_parses_response(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    monkeypatch.setattr(
+        client.client, "request", AsyncMock(return_value=_response(200, b'{"markets": [{"ticker": "A"}]}'))
+    )
+
+    result = await client._make_authenticated_request(
+        "POST", "/trade-api/v2/markets", json_data={"b": 1, "a": [1, 2]}, require_auth=False
+    )
+
+    assert result == {"markets": [{"ticker": "A"}]}
+    sent_body = client.client.request.call_args.kwargs["content"]
+    assert sent_body == b'{"b":1,"a":[1,2]}'
+    await client.close()
+
+
+async def test_request_returns_empty_dict_for_empty_body(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(200)))
+
+    result = await client._make_authenticated_request(
+        "DELETE", "/trade-api/v2/portfolio/order_groups/g1", require_auth=False
+    )
+
+    assert result == {}
+    await client.close()
+
+
+async def test_amend_order_requires_exactly_one_price():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    with pytest.raises(ValueError):
+        await client.amend_order("o", "MKT", "yes", "buy", "a", "b")
+    with pytest.raises(ValueError):
+        await client.amend_order("o", "MKT", "yes", "buy", "a", "b", yes_price=50, no_price=50)
+
+    await client.amend_order("o", "MKT", "yes", "buy", "a", "b", no_price_dollars="0.4500", count=3)
+    sent = client._make_authenticated_request.call_args.kwargs["json_data"]
+    assert sent == {
+        "ticker": "MKT",
+        "side": "yes",
+        "action": "buy",
+        "client_order_id": "a",
+        "updated_client_order_id": "b",
+        "no_price_dollars": "0.4500",
+        "count": 3,
+    }
+    await client.close()
+
+
+async def test_decrease_order_validation():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    with pytest.raises(ValueError):
+        await client.decrease_order("o")
+    with pytest.raises(ValueError):
+        await client.decrease_order("o", reduce_by=1, reduce_to=1)
+    with pytest.raises(ValueError):
+        await client.decrease_order("o", reduce_by=0)
+    with pytest.raises(ValueError):
+        await client.decrease_order("o", reduce_to=-1)
+
+    await client.decrease_order("o", reduce_to=0)
+    assert client._make_authenticated_request.call_args.kwargs["json_data"] == {"reduce_to": 0}
+    await client.close()
+
+
+async def test_signature_reused_within_same_millisecond():
+    client = KalshiClient(api_key="test-key")
+    calls = []
+
+    def fake_sign(timestamp, method, path):
+        calls.append((timestamp, method, path))
+        return f"sig-{len(calls)}"
+
+    client._sign_request = fake_sign
+
+    assert client._cached_signature("1000", "GET", "/a") == "sig-1"
+    assert client._cached_signature("1000", "GET", "/a") == "sig-1"
+    assert client._cached_signature("1000", "POST", "/a") == "sig-2"
+    assert client._cached_signature("1001", "GET", "/a") == "sig-3"
+    assert len(calls) == 3
+    await client.close()
+
+
+async def test_iter_all_events_yields_items_across_pages():
+    client = KalshiClient(api_key="test-key")
+    pages = {
+        None: {"events": [{"event_ticker": "E1"}], "cursor": "c1"},
+        "c1": {"events": [{"event_ticker": "E2"}, {"event_ticker": "E3"}], "cursor": None},
+    }
+
+    async def fake_get_events(cursor=None, **kwargs):
+        return pages[cursor]
+
+    client.get_events = fake_get_events
+
+    seen = [event["event_ticker"] async for event in client.iter_all_events(max_items=2)]
+
+    assert seen == ["E1", "E2"]
+    await client.close()
+
+
+async def test_offset_cursors_fan_out_remaining_pages():
+    client = KalshiClient(api_key="test-key")
+    requested = []
+
+    async def fake_get_series(cursor=None, **kwargs):
+        requested.append(cursor)
+        offset = int(cursor or 0)
+        return {
+            "series": [{"ticker": f"S{offset + i}"} for i in range(2)],
+            "cursor": str(offset + 2),
+        }
+
+    client.get_series = fake_get_series
+
+    series = await client.get_all_series(max_items=7)
+
+    assert [s["ticker"] for s in series] == [f"S{i}" for i in range(7)]
+    assert requested == [None, "2", "4", "6"]
+    await client.close()
+
+
+async def test_make_amender_fills_template():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    amend = client.make_amender("MKT", "no", "sell", "orig", price_field="no_price")
+    await amend("order-1", "new-1", 42, 7)
+
+    args = client._make_authenticated_request.call_args
+    assert args.args == ("POST", "/trade-api/v2/portfolio/orders/order-1/amend")
+    assert args.kwargs["json_data"] == {
+        "ticker": "MKT",
+        "side": "no",
+        "action": "sell",
+        "client_order_id": "orig",
+        "updated_client_order_id": "new-1",
+        "no_price": 42,
+        "count": 7,
+    }
+    with pytest.raises(ValueError):
+        client.make_amender("MKT", "yes", "buy", "orig", price_field="price")
+    await client.close()
+
+
+async def test_api_key_methods_reject_empty_fields():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    with pytest.raises(ValueError, match="public_key cannot be empty"):
+        await client.create_api_key("bot", "")
+    with pytest.raises(ValueError, match="name cannot be empty"):
+        await client.generate_api_key("")
+    with pytest.raises(ValueError, match="api_key_id cannot be empty"):
+        await client.delete_api_key("")
+    client._make_authenticated_request.assert_not_called()
+    await client.close()
+
+
+async def test_exchange_status_is_cached_and_shared():
+    client = KalshiClient(api_key="test-key")
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        await asyncio.sleep(0)
+        return {"trading_active": True}
+
+    client._make_authenticated_request = fake_request
+
+    results = await asyncio.gather(*(client.get_exchange_status() for _ in range(5)))
+    await client.get_exchange_status()
+
+    assert all(r == {"trading_active": True} for r in results)
+    assert calls == ["/trade-api/v2/exchange/status"]
+
+    client._ttl_cache.clear()
+    await client.get_exchange_status()
+    assert len(calls) == 2
+    await client.close()
+
+
+async def test_signed_request_does_not_mutate_base_headers(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    client.private_key = object()
+    client._cached_signature = lambda timestamp, method, path: "sig"
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(200, b"{}")))
+
+    await client._make_authenticated_request("GET", "/trade-api/v2/portfolio/balance")
+
+    headers = client.client.request.call_args.kwargs["headers"]
+    assert headers["KALSHI-ACCESS-KEY"] == "test-key"
+    assert headers["KALSHI-ACCESS-SIGNATURE"] == "sig"
+    assert "KALSHI-ACCESS-KEY" not in KalshiClient._BASE_HEADERS
+    await client.close()
+
+
+async def test_use_api_key_loads_pem_once_and_resets_signatures():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+    client = KalshiClient(api_key="old-key")
+    client._signatures[("GET", "/a")] = "stale"
+
+    client.use_api_key("new-key", pem)
+
+    assert client.api_key == "new-key"
+    assert client.private_key.private_numbers() == key.private_numbers()
+    assert client._signatures == {}
+    assert client._sign_request("1000", "GET", "/a")
+    with pytest.raises(KalshiAPIError):
+        client.use_api_key("new-key", "not a pem")
+    await client.close()
+
+
+async def test_order_group_heartbeat_resets_over_ws_until_deleted():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+    trader = FakeWsTrader(response={})
+    client.attach_ws_trader(trader)
+
+    client.start_order_group_heartbeat("group-1", interval=0.01)
+    await asyncio.sleep(0.05)
+    await client.delete_order_group("group-1")
+    resets = len(trader.calls)
+    await asyncio.sleep(0.03)
+
+    assert resets >= 2
+    assert len(trader.calls) == resets
+    assert trader.calls[0] == ("reset_order_group", {"order_group_id": "group-1"})
+    client._make_authenticated_request.assert_awaited_once_with(
+        "DELETE", "/trade-api/v2/portfolio/order_groups/group-1"
+    )
+    await client.close()
+
+
+async def test_queue_position_lookups_are_coalesced():
+    client = KalshiClient(api_key="test-key")
+    batch_calls = []
+
+    async def fake_get_queue_positions(market_tickers=None, event_ticker=None):
+        batch_calls.append(market_tickers)
+        return {"queue_positions": [
+            {"order_id": "o1", "market_ticker": "A", "queue_position": 3},
+            {"order_id": "o2", "market_ticker": "B", "queue_position": 7},
+        ]}
+
+    client.get_queue_positions = fake_get_queue_positions
+    client._make_authenticated_request = AsyncMock(return_value={"queue_position": 0})
+
+    results = await asyncio.gather(
+        client.get_order_queue_position("o1", ticker="A"),
+        client.get_order_queue_position("o2", ticker="B"),
+        client.get_order_queue_position("o3", ticker="A"),
+    )
+
+    assert results == [{"queue_position": 3}, {"queue_position": 7}, {"queue_position": 0}]
+    assert batch_calls == [["A", "B"]]
+    client._make_authenticated_request.assert_awaited_once_with(
+        "GET", "/trade-api/v2/portfolio/orders/o3/queue_position"
+    )
+    await client.close()
+
+
+async def test_get_all_markets_as_dataclass():
+    client = KalshiClient(api_key="test-key")
+
+    async def fake_get_markets(cursor=None, **kwargs):
+        return {"markets": [{"ticker": "A", "yes_bid": 40, "yes_ask": 42, "extra": 1}], "cursor": ""}
+
+    client.get_markets = fake_get_markets
+
+    (market,) = await client.get_all_markets(as_dataclass=True)
+
+    assert isinstance(market, MarketSnapshot)
+    assert (market.ticker, market.yes_bid, market.yes_ask, market.volume) == ("A", 40, 42, 0)
+    assert not hasattr(market, "__dict__")
+    await client.close()
+
+
+async def test_request_url_resolves_against_client_base_url(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    monkeypatch.setattr(client.client, "send", AsyncMock(return_value=_response(200, b"{}")))
+
+    await client._make_authenticated_request(
+        "GET", "/trade-api/v2/markets", params={"limit": 5}, require_auth=False
+    )
+
+    sent = client.client.send.call_args.args[0]
+    assert str(sent.url) == f"{client.base_url}/trade-api/v2/markets?limit=5"
+    await client.close()
+
+
+async def test_list_params_skip_empty_filters():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    await client.get_markets(limit=50, status="open", tickers=["A", "B"])
+    assert client._make_authenticated_request.call_args.kwargs["params"] == {
+        "limit": 50, "status": "open", "tickers": "A,B"
+    }
+
+    await client.get_series(tags=["x"], include_volume=True)
+    assert client._make_authenticated_request.call_args.kwargs["params"] == {
+        "tags": "x", "include_volume": "true", "limit": 100
+    }
+    await client.close()
+
+
+async def test_fcm_and_milestone_params_map_renamed_fields():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    await client.get_fcm_orders("sub-1", ticker="MKT", limit=10)
+    assert client._make_authenticated_request.call_args.kwargs["params"] == {
+        "subtrader_id": "sub-1", "ticker": "MKT", "limit": 10
+    }
+
+    await client.get_milestones(limit=20, milestone_type="game", cursor="c")
+    assert client._make_authenticated_request.call_args.kwargs["params"] == {
+        "limit": 20, "type": "game", "cursor": "c"
+    }
+    await client.close()
+
+
+async def test_public_reference_gets_are_cached_until_invalidated():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={"milestone": {"id": "m1"}})
+
+    first = await client.get_milestone("m1")
+    second = await client.get_milestone("m1")
+    await client.get_milestones(limit=10)
+    await client.get_milestones(limit=20)
+
+    assert first is second
+    assert client._make_authenticated_request.await_count == 3
+
+    client.invalidate_cache("/trade-api/v2/milestones/")
+    await client.get_milestone("m1")
+    await client.get_milestones(limit=10)
+    assert client._make_authenticated_request.await_count == 4
+
+    client._response_cache_size = 1
+    await client.get_structured_target("t1")
+    assert list(client._response_cache) == [("/trade-api/v2/structured_targets/t1", ())]
+    await client.close()
+
+
+async def test_concurrent_identical_public_gets_share_one_request():
+    client = KalshiClient(api_key="test-key")
+    sent = []
+
+    async def fake_send(method, endpoint, params, json_data, require_auth):
+        sent.append((method, endpoint, params))
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    client._send_request = fake_send
+
+    results = await asyncio.gather(
+        client._make_authenticated_request("GET", "/x", params={"a": 1}, require_auth=False),
+        client._make_authenticated_request("GET", "/x", params={"a": 1}, require_auth=False),
+        client._make_authenticated_request("GET", "/x", params={"a": 2}, require_auth=False),
+        client._make_authenticated_request("GET", "/x", params={"a": 1}),
+    )
+
+    assert results == [{"ok": True}] * 4
+    assert len(sent) == 3
+    assert client._inflight == {}
+    await client.close()
+
+
+async def test_paginate_all_walks_any_list_method():
+    client = KalshiClient(api_key="test-key")
+    pages = {
+        None: {"milestones": [{"id": "m1"}], "cursor": "c1"},
+        "c1": {"milestones": [{"id": "m2"}], "cursor": ""},
+    }
+    seen_kwargs = []
+
+    async def fake_get_milestones(cursor=None, **kwargs):
+        seen_kwargs.append(kwargs)
+        return pages[cursor]
+
+    milestones = await client.paginate_all(fake_get_milestones, "milestones", category="Sports")
+
+    assert [m["id"] for m in milestones] == ["m1", "m2"]
+    assert seen_kwargs == [{"category": "Sports"}] * 2
+    await client.close()
+
+
+async def test_json_helpers_match_without_orjson(monkeypatch):
+    from src.clients import kalshi_client
+
+    payload = {"b": 1, "a": [1, 2], "s": "é"}
+    fast = (kalshi_client._json_dumps(payload), kalshi_client._json_loads(b'{"x": [1, 2.5]}'))
+    monkeypatch.setattr(kalshi_client, "ORJSON_AVAILABLE", False)
+    slow = (kalshi_client._json_dumps(payload), kalshi_client._json_loads(b'{"x": [1, 2.5]}'))
+
+    assert fast == slow
+
+
+async def test_token_bucket_shapes_bursts_to_rate():
+    from src.clients.kalshi_client import _TokenBucket
+
+    bucket = _TokenBucket(rate=100, capacity=2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+    elapsed = loop.time() - start
+
+    # Two tokens are free, the other three arrive 10ms apart
+    assert 0.025 <= elapsed < 0.2
+
+
+async def test_requests_draw_from_read_or_write_bucket(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(200, b"{}")))
+    taken = []
+
+    class RecordingBucket:
+        def __init__(self, name):
+            self.name = name
+
+        async def acquire(self):
+            taken.append(self.name)
+
+    original = KalshiClient._rate_buckets
+    KalshiClient._rate_buckets = {"read": RecordingBucket("read"), "write": RecordingBucket("write")}
+    try:
+        await client._make_authenticated_request("GET", "/a", require_auth=False)
+        await client._make_authenticated_request("POST", "/b", json_data={"x": 1}, require_auth=False)
+    finally:
+        KalshiClient._rate_buckets = original
+
+    assert taken == ["read", "write"]
+    await client.close()
+
+
+async def test_adaptive_limiter_aimd():
+    from src.clients.kalshi_client import _AdaptiveLimiter
+
+    limiter = _AdaptiveLimiter(initial=2, minimum=1, maximum=3, window=2, increase=1)
+
+    await limiter.acquire()
+    await limiter.acquire()
+    blocked = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    limiter.release()
+    await asyncio.sleep(0)
+    assert blocked.done()
+
+    limiter.release()
+    limiter.release()
+    assert limiter.limit == 3
+
+    await limiter.acquire()
+    limiter.release(congested=True)
+    assert limiter.limit == 1.5
+    assert limiter._in_flight == 0
+
+
+async def test_429_retry_waits_for_retry_after(monkeypatch):
+    _skip_health_tracking(monkeypatch)
+    client = KalshiClient(api_key="test-key", max_retries=2)
+    monkeypatch.setattr(client.client, "request", AsyncMock(side_effect=[
+        _response(429, headers={"Retry-After": "3"}),
+        _response(200, b'{"ok": true}'),
+    ]))
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    result = await client._make_authenticated_request("POST", "/x", json_data={"a": 1}, require_auth=False)
+
+    assert result == {"ok": True}
+    assert 3.0 in sleeps
+    await client.close()
+
+
+async def test_low_rate_limit_remaining_pauses_endpoint():
+    client = KalshiClient(api_key="test-key")
+
+    client._note_rate_limit_headers(
+        "/x", _response(200, headers={"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "5"})
+    )
+    assert client._endpoint_pause_until["/x"] > 0
+
+    client._note_rate_limit_headers("/x", _response(200, headers={"X-RateLimit-Remaining": "50"}))
+    assert "/x" not in client._endpoint_pause_until
+    await client.close()
+
+
+async def test_get_milestones_by_ids_bounds_concurrency_and_keeps_order():
+    client = KalshiClient(api_key="test-key")
+    active = 0
+    peak = 0
+
+    async def fake_get_milestone(milestone_id):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return {"milestone": {"id": milestone_id}}
+
+    client.get_milestone = fake_get_milestone
+
+    ids = [f"m{i}" for i in range(10)]
+    results = await client.get_milestones_by_ids(ids, max_concurrency=3)
+
+    assert [r["milestone"]["id"] for r in results] == ids
+    assert peak == 3
+    await client.close()
+
+
+async def test_milestones_as_dataclass_leaves_cached_page_untouched():
+    from src.clients.kalshi_client import Milestone
+
+    client = KalshiClient(api_key="test-key")
+    raw = {"milestones": [{"id": "m1", "category": "Sports", "related_event_tickers": ["E1"]}], "cursor": "c"}
+    client._make_authenticated_request = AsyncMock(return_value=raw)
+
+    page = await client.get_milestones(limit=10, as_dataclass=True)
+
+    assert page["cursor"] == "c"
+    assert page["milestones"] == [Milestone(id="m1", category="Sports", related_event_tickers=("E1",))]
+    assert (await client.get_milestones(limit=10))["milestones"][0] == raw["milestones"][0]
+    await client.close()
+
+
+async def test_incentive_and_fcm_pages_as_dataclass():
+    from src.clients.kalshi_client import FcmOrder, FcmPosition, IncentiveProgram
+
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(side_effect=[
+        {"incentive_programs": [{"id": "p1", "market_ticker": "MKT", "paid_out": True}]},
+        {"orders": [{"order_id": "o1", "ticker": "MKT", "yes_price": 45}], "cursor": ""},
+        {"market_positions": [{"ticker": "MKT", "position": 3}], "event_positions": [{"event_ticker": "E"}]},
+    ])
+
+    programs = await client.get_incentive_programs(as_dataclass=True)
+    orders = await client.get_fcm_orders("sub-1", as_dataclass=True)
+    positions = await client.get_fcm_positions("sub-1", as_dataclass=True)
+
+    assert programs["incentive_programs"] == [IncentiveProgram(id="p1", market_ticker="MKT", paid_out=True)]
+    assert orders["orders"] == [FcmOrder(order_id="o1", ticker="MKT", yes_price=45)]
+    assert positions["market_positions"] == [FcmPosition(ticker="MKT", position=3)]
+    assert positions["event_positions"] == [{"event_ticker": "E"}]
+    assert isinstance((await client.get_incentive_programs())["incentive_programs"][0], dict)
+    await client.close()
+
+
+async def test_portfolio_and_event_params_drop_unset_filters():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    await client.get_orders(limit=500, status="resting")
+    assert client._make_authenticated_request.call_args.kwargs["params"] == {
+        "limit": 200, "status": "resting"
+    }
+
+    await client.get_events(limit=10, with_nested_markets=True, series_ticker="S")
+    assert client._make_authenticated_request.call_args.kwargs["params"] == {
+        "limit": 10, "with_nested_markets": "true", "series_ticker": "S"
+    }
+    await client.close()
+
+
+async def test_only_gets_retry_server_errors(monkeypatch):
+    _skip_health_tracking(monkeypatch)
+    real_sleep = asyncio.sleep
+
+    async def fast_sleep(delay):
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
+
+    client = KalshiClient(api_key="test-key", max_retries=3)
+    monkeypatch.setattr(
+        client.client, "request", AsyncMock(side_effect=[_response(503), _response(200, b'{"ok": 1}')])
+    )
+    assert await client._make_authenticated_request("GET", "/a", require_auth=False) == {"ok": 1}
+
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(503)))
+    with pytest.raises(KalshiAPIError):
+        await client._make_authenticated_request("POST", "/b", json_data={"x": 1}, require_auth=False)
+    assert client.client.request.await_count == 1
+
+    monkeypatch.setattr(client.client, "request", AsyncMock(side_effect=httpx.ConnectError("boom")))
+    with pytest.raises(KalshiAPIError):
+        await client._make_authenticated_request("DELETE", "/c", require_auth=False)
+    assert client.client.request.await_count == 1
+    await client.close()
+
+
+async def test_backoff_delay_is_jittered_and_capped():
+    client = KalshiClient(api_key="test-key", backoff_factor=1.0)
+    delays = [client._backoff_delay(10) for _ in range(50)]
+
+    assert all(0 <= d <= KalshiClient._MAX_BACKOFF for d in delays)
+    assert len(set(delays)) > 1
+    await client.close()
+
+
+async def test_clients_share_one_http_pool_until_last_close():
+    first = KalshiClient(api_key="a")
+    second = KalshiClient(api_key="b")
+
+    assert first.client is second.client
+    await first.close()
+    await first.close()
+    assert not second.client.is_closed
+
+    await second.close()
+    assert second.client.is_closed
+
+    third = KalshiClient(api_key="c")
+    assert not third.client.is_closed
+    await third.close()
+
+
+async def test_shared_http_client_is_rebuilt_for_each_event_loop():
+    from src.clients import kalshi_client
+
+    client = KalshiClient(api_key="test-key")
+    home = client.client
+
+    async def bound_client():
+        return client.client
+
+    # A second asyncio.run() in the process must not reuse this loop's sockets
+    other = await asyncio.to_thread(asyncio.run, bound_client())
+
+    assert other is not home
+    assert client.client is not other
+    assert not any(loop and loop.is_closed() for loop, _ in kalshi_client._shared_http_clients)
+    await client.close()
+
+
+async def test_shared_http_client_is_per_base_url(monkeypatch):
+    from src.clients import kalshi_client
+
+    prod = KalshiClient(api_key="a")
+    monkeypatch.setattr(kalshi_client.settings.api, "kalshi_base_url", "https://demo-api.kalshi.co")
+    demo = KalshiClient(api_key="b")
+    demo_peer = KalshiClient(api_key="c")
+
+    assert demo.client is not prod.client
+    assert demo.client is demo_peer.client
+    assert demo.client.base_url.host == "demo-api.kalshi.co"
+
+    await demo.close()
+    await demo_peer.close()
+    assert demo.client.is_closed
+    assert not prod.client.is_closed
+    await prod.close()
+
+
+async def test_fcm_polling_serves_many_readers_from_one_poll():
+    client = KalshiClient(api_key="test-key")
+    polls = []
+
+    async def fake_positions(subtrader_id):
+        polls.append(subtrader_id)
+        return {"market_positions": [len(polls)]}
+
+    client.get_fcm_positions = fake_positions
+    client.get_fcm_orders = AsyncMock(return_value={"orders": []})
+
+    with pytest.raises(KalshiAPIError):
+        await client.fcm_positions_latest("sub-1")
+
+    client.start_fcm_polling("sub-1", interval=60)
+    readers = await asyncio.gather(*(client.fcm_positions_latest("sub-1") for _ in range(5)))
+
+    assert readers == [{"market_positions": [1]}] * 5
+    assert await client.fcm_orders_latest("sub-1") == {"orders": []}
+    assert polls == ["sub-1"]
+    await client.close()
+    assert client._fcm_pollers == {}
+
+
+async def test_fcm_readers_fail_instead_of_hanging():
+    client = KalshiClient(api_key="test-key")
+    client.get_fcm_positions = AsyncMock(side_effect=KalshiAPIError("503"))
+    client.get_fcm_orders = AsyncMock(return_value={"orders": []})
+
+    client.start_fcm_polling("sub-1", interval=60)
+    with pytest.raises(KalshiAPIError, match="FCM poll failed"):
+        await client.fcm_positions_latest("sub-1")
+
+    with pytest.raises(KalshiAPIError, match="Timed out"):
+        await client.fcm_orders_latest("sub-1", wait=True, timeout=0.01)
+
+    waiter = asyncio.create_task(client.fcm_orders_latest("sub-1", wait=True))
+    await asyncio.sleep(0)
+    client.stop_fcm_polling("sub-1")
+    with pytest.raises(KalshiAPIError, match="stopped"):
+        await waiter
+    await client.close()
+
+
+async def test_fetch_all_helpers_request_max_page_sizes():
+    client = KalshiClient(api_key="test-key")
+    client.get_milestones = AsyncMock(return_value={"milestones": [{"id": "m1"}], "cursor": ""})
+    client.get_fcm_orders = AsyncMock(return_value={"orders": [{"order_id": "o1"}], "cursor": ""})
+
+    assert await client.fetch_all_milestones(category="Sports") == [{"id": "m1"}]
+    assert await client.fetch_all_fcm_orders("sub-1") == [{"order_id": "o1"}]
+
+    client.get_milestones.assert_awaited_once_with(cursor=None, limit=500, category="Sports")
+    client.get_fcm_orders.assert_awaited_once_with(cursor=None, subtrader_id="sub-1", limit=1000)
+    await client.close()
+
+
+async def test_make_milestone_query_binds_filters():
+    client = KalshiClient(api_key="test-key")
+    client.get_milestones = AsyncMock(return_value={"milestones": []})
+
+    elections = client.make_milestone_query(category="election")
+    await elections(cursor="c1")
+
+    client.get_milestones.assert_awaited_once_with(limit=500, category="election", cursor="c1")
+    with pytest.raises(ValueError):
+        client.make_milestone_query(limit=501)
+    await client.close()
+
+
+async def test_sign_request_strips_query_from_signed_path():
+    import base64
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+    client = KalshiClient(api_key="test-key")
+    client.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    signature = client._sign_request("1700000000000", "get", "/trade-api/v2/portfolio/orders?limit=5")
+
+    client.private_key.public_key().verify(
+        base64.b64decode(signature),
+        b"1700000000000GET/trade-api/v2/portfolio/orders",
+        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
+        hashes.SHA256(),
+    )
+    await client.close()
+
+
+async def test_sign_request_supports_ed25519_keys():
+    import base64
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    client = KalshiClient(api_key="test-key")
+    client.private_key = ed25519.Ed25519PrivateKey.generate()
+
+    signature = client._sign_request("1700000000000", "POST", "/trade-api/v2/portfolio/orders")
+
+    client.private_key.public_key().verify(
+        base64.b64decode(signature), b"1700000000000POST/trade-api/v2/portfolio/orders"
+    )
+    await client.close()
+
+
+async def test_each_retry_attempt_is_signed_afresh(monkeypatch):
+    _skip_health_tracking(monkeypatch)
+    client = KalshiClient(api_key="test-key", max_retries=2)
+    client.private_key = object()
+    signed = []
+
+    def fake_signature(timestamp, method, path):
+        signed.append(timestamp)
+        return f"sig-{len(signed)}"
+
+    client._cached_signature = fake_signature
+    monkeypatch.setattr(client.client, "request", AsyncMock(side_effect=[
+        _response(429, headers={"Retry-After": "0"}),
+        _response(200, b"{}"),
+    ]))
+
+    await client._make_authenticated_request("GET", "/trade-api/v2/portfolio/balance")
+
+    sent = [call.kwargs["headers"]["KALSHI-ACCESS-SIGNATURE"] for call in client.client.request.call_args_list]
+    assert sent == ["sig-1", "sig-2"]
+    await client.close()
+
+
+async def test_iceberg_order_submits_chunks_in_parallel_without_delay():
+    client = KalshiClient(api_key="test-key")
+    counts = []
+
+    async def fake_place(**kwargs):
+        counts.append(kwargs["count"])
+        if len(counts) == 2:
+            raise KalshiAPIError("rejected")
+        return {"order": {"count": kwargs["count"]}}
+
+    client.place_smart_limit_order = fake_place
+
+    orders = await client.place_iceberg_order("MKT", "yes", "buy", total_count=12, chunk_size=5)
+
+    assert sorted(counts) == [2, 5, 5]
+    assert len(orders) == 2
+    await client.close()
+
+
+async def test_place_order_fills_market_defaults_from_tables():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={})
+
+    await client.place_order("MKT", "id-1", "NO", "BUY", 3, type_="market")
+    assert client._make_authenticated_request.call_args.kwargs["json_data"] == {
+        "ticker": "MKT", "client_order_id": "id-1", "side": "no", "action": "buy", "count": 3,
+        "type": "market", "no_price": 99, "buy_max_cost": 297, "time_in_force": "good_till_canceled",
+    }
+
+    await client.place_order("MKT", "id-2", "yes", "sell", 1, type_="market")
+    assert client._make_authenticated_request.call_args.kwargs["json_data"]["yes_price"] == 1
+
+    with pytest.raises(ValueError, match="Limit NO orders require no_price"):
+        await client.place_order("MKT", "id-3", "no", "buy", 1, type_="limit")
+    await client.close()
+
+
+async def test_market_reads_share_a_short_lived_response(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(200, b'{"market": {}}')))
+
+    await asyncio.gather(*(client.get_market("MKT") for _ in range(3)))
+    await client.get_market("MKT")
+    assert client.client.request.await_count == 1
+
+    monkeypatch.setattr(KalshiClient, "_MARKET_DATA_TTL", 0.0)
+    await client.get_orderbook("MKT")
+    await client.get_orderbook("MKT")
+    assert client.client.request.await_count == 3
+    await client.close()
+
+
+async def test_list_params_share_in_flight_get(monkeypatch):
+    client = KalshiClient(api_key="test-key")
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(200, b'{"live_datas": []}')))
+
+    results = await asyncio.gather(
+        client.get_multiple_live_data(["m-1", "m-2"]),
+        client.get_multiple_live_data(["m-1", "m-2"]),
+    )
+
+    assert results == [{"live_datas": []}] * 2
+    assert client.client.request.await_count == 1
+    assert client.client.request.call_args.kwargs["params"] == {"milestone_ids": ["m-1", "m-2"]}
+    await client.close()
+
+
+async def test_private_key_is_loaded_at_construction():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    pem = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+    client = KalshiClient(api_key="test-key", private_key_pem=pem)
+    assert client.private_key is not None
+
+    broken = KalshiClient(api_key="test-key", private_key_pem="not a key")
+    assert broken.private_key is None
+    await client.close()
+    await broken.close()
+
+
+async def test_queued_orders_flush_as_one_batch():
+    client = KalshiClient(api_key="test-key")
+    client.batch_create_orders = AsyncMock(return_value={"orders": [
+        {"client_order_id": "a", "order": {"order_id": "o-a"}},
+        {"client_order_id": "b", "error": {"code": "insufficient_balance"}},
+    ]})
+
+    results = await asyncio.gather(
+        client.queue_order(ticker="MKT", client_order_id="a", count=1),
+        client.queue_order(ticker="MKT", client_order_id="b", count=1),
+        return_exceptions=True,
+    )
+
+    assert results[0] == {"order": {"order_id": "o-a"}}
+    assert isinstance(results[1], KalshiAPIError)
+    client.batch_create_orders.assert_awaited_once_with([
+        {"ticker": "MKT", "client_order_id": "a", "count": 1},
+        {"ticker": "MKT", "client_order_id": "b", "count": 1},
+    ])
+    await client.close()
+
+
+async def test_401_is_retried_once_with_a_fresh_signature(monkeypatch):
+    _skip_health_tracking(monkeypatch)
+    client = KalshiClient(api_key="test-key")
+    client.private_key = object()
+    client._cached_signature = lambda timestamp, method, path: "sig"
+    monkeypatch.setattr(client.client, "request", AsyncMock(return_value=_response(401, b"stale")))
+
+    with pytest.raises(KalshiAPIError, match="HTTP 401"):
+        await client._make_authenticated_request("POST", "/trade-api/v2/portfolio/orders", json_data={"a": 1})
+    assert client.client.request.await_count == 2
+    await client.close()
+
+
+async def test_batch_cancel_splits_into_slabs_and_merges_in_order():
+    client = KalshiClient(api_key="test-key")
+    slabs = []
+
+    async def fake_request(method, endpoint, json_data=None, **kwargs):
+        slabs.append(json_data["ids"])
+        if json_data["ids"][0] == "id-20":
+            raise KalshiAPIError("boom")
+        return {"orders": [{"order_id": order_id} for order_id in json_data["ids"]]}
+
+    client._make_authenticated_request = fake_request
+    ids = [f"id-{n}" for n in range(45)]
+
+    result = await client.batch_cancel_orders(ids)
+
+    assert [len(slab) for slab in slabs] == [20, 20, 5]
+    assert [entry["order_id"] for entry in result["orders"]] == ids
+    assert result["orders"][20]["error"] == {"message": "boom"}
+    assert "error" not in result["orders"][40]
+    await client.close()
+
+
+async def test_series_lookups_are_cached_per_arguments():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={"series": []})
+
+    await client.get_series(category="Politics")
+    await client.get_series(category="Politics")
+    await client.get_series(category="Sports")
+    await client.get_series_info("PRES")
+    await client.get_series_info("PRES")
+
+    assert client._make_authenticated_request.await_count == 3
+    await client.close()
+
+
+async def test_warm_up_swallows_connection_errors():
+    client = KalshiClient(api_key="test-key")
+    client.get_exchange_status = AsyncMock(side_effect=KalshiAPIError("unreachable"))
+
+    await client.warm_up()
+
+    client.get_exchange_status.assert_awaited_once()
+    await client.close()
+
+
+async def test_join_csv_passes_prejoined_strings_through():
+    client = KalshiClient(api_key="test-key")
+
+    assert client._join_csv("A,B") == "A,B"
+    assert client._join_csv(["A", "B"]) == "A,B"
+    assert client._csv_cache == {("A", "B"): "A,B"}
+    await client.close()
+
+
+async def test_batch_candlesticks_counts_tickers_in_joined_string():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={"markets": []})
+    joined = ",".join(f"KXHIGHNY-25JAN01-T{i}" for i in range(100))
+
+    await client.get_batch_market_candlesticks(joined, start_ts=0, end_ts=60, period_interval=1)
+
+    params = client._make_authenticated_request.await_args.kwargs["params"]
+    assert params["market_tickers"] == joined
+    with pytest.raises(ValueError):
+        await client.get_batch_market_candlesticks(joined + ",ONE-MORE", start_ts=0, end_ts=60, period_interval=1)
+    await client.close()
+
+
+async def test_amend_orders_keeps_failures_in_place():
+    client = KalshiClient(api_key="test-key")
+
+    async def fake_amend(order_id, **kwargs):
+        if order_id == "bad":
+            raise KalshiAPIError("rejected")
+        return {"order": {"order_id": order_id}}
+
+    client.amend_order = fake_amend
+
+    results = await client.amend_orders([{"order_id": "a"}, {"order_id": "bad"}, {"order_id": "c"}])
+
+    assert results[0] == {"order": {"order_id": "a"}}
+    assert isinstance(results[1], KalshiAPIError)
+    assert results[2] == {"order": {"order_id": "c"}}
+    await client.close()
+
+
+async def test_amend_orders_sends_nearest_to_mid_first():
+    client = KalshiClient(api_key="test-key")
+    sent = []
+
+    async def fake_amend(order_id, **kwargs):
+        sent.append(order_id)
+        return {"order": {"order_id": order_id}}
+
+    client.amend_order = fake_amend
+    amendments = [
+        {"order_id": "far", "ticker": "MKT", "yes_price": 30},
+        {"order_id": "unknown", "ticker": "OTHER", "yes_price": 50},
+        {"order_id": "near", "ticker": "MKT", "no_price": 49},
+    ]
+
+    results = await client.amend_orders(amendments, max_concurrency=1, mids={"MKT": 50})
+
+    assert sent == ["near", "far", "unknown"]
+    assert [r["order"]["order_id"] for r in results] == ["far", "unknown", "near"]
+    await client.close()
+
+
+async def test_concurrent_unbatched_queue_position_lookups_share_a_request():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(return_value={"queue_position": 3})
+
+    results = await asyncio.gather(*(client.get_order_queue_position("o1") for _ in range(4)))
+
+    assert results == [{"queue_position": 3}] * 4
+    client._make_authenticated_request.assert_awaited_once()
+    assert client._inflight == {}
+    await client.close()
+
+
+async def test_hot_reads_can_decode_to_dataclasses():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(side_effect=[
+        {"markets": [{"ticker": "MKT", "yes_bid": 40}], "cursor": ""},
+        {"queue_positions": [{"order_id": "o1", "market_ticker": "MKT", "queue_position": 7}]},
+    ])
+
+    markets = await client.get_markets(as_dataclass=True)
+    positions = await client.get_queue_positions(market_tickers=["MKT"], as_dataclass=True)
+
+    assert markets["markets"][0] == MarketSnapshot(ticker="MKT", yes_bid=40)
+    assert positions["queue_positions"] == [QueuePosition("o1", "MKT", 7)]
+    await client.close()
+
+
+async def test_current_limit_reports_adaptive_concurrency(monkeypatch):
+    from src.clients.kalshi_client import _AdaptiveLimiter
+
+    client = KalshiClient(api_key="test-key")
+    limiter = _AdaptiveLimiter(initial=8)
+    monkeypatch.setattr(KalshiClient, "_concurrency", limiter)
+
+    await limiter.acquire()
+    limiter.release(congested=True)
+
+    assert client.get_current_limit() == 4
+    await client.close()
+
+
+async def test_close_fails_pending_queue_position_lookups():
+    client = KalshiClient(api_key="test-key")
+    client.get_queue_positions = AsyncMock()
+    client._qp_window = 60
+
+    lookup = asyncio.create_task(client.get_order_queue_position("o-1", ticker="MKT"))
+    await asyncio.sleep(0)
+    await client.close()
+
+    with pytest.raises(KalshiAPIError, match="closed"):
+        await lookup
+    client.get_queue_positions.assert_not_called()
+
+
+async def test_close_fails_queued_orders_that_were_not_sent():
+    client = KalshiClient(api_key="test-key")
+    client.batch_create_orders = AsyncMock()
+    client._order_window = 60
+
+    order = asyncio.create_task(client.queue_order(ticker="MKT", side="yes", action="buy", count=1))
+    await asyncio.sleep(0)
+    await client.close()
+
+    with pytest.raises(KalshiAPIError, match="closed before queued order"):
+        await order
+    client.batch_create_orders.assert_not_called()
+
+
+async def test_invalidate_cache_prefix_reaches_ttl_cached_endpoints():
+    client = KalshiClient(api_key="test-key")
+    client._make_authenticated_request = AsyncMock(side_effect=[{"v": 1}, {"v": 2}, {"v": 3}])
+
+    assert await client.get_exchange_status() == {"v": 1}
+    assert await client.get_exchange_schedule() == {"v": 2}
+    client.invalidate_cache("/trade-api/v2/exchange/status")
+
+    assert await client.get_exchange_status() == {"v": 3}
+    assert await client.get_exchange_schedule() == {"v": 2}
+    await client.close()
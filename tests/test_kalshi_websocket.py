@@ -0,0 +1,309 @@
+import asyncio
+import json
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+
+from src.clients.kalshi_client import KalshiClient, WebSocketSendError
+from src.clients.kalshi_websocket import KalshiWebSocketClient, PriceUpdateAggregator
+
+# Mark all tests in this file as async
+pytestmark = pytest.mark.asyncio
+
+
+class FakeWebSocket:
+    """Stand-in for a websockets connection that records sent frames."""
+
+    def __init__(self, frames=()):
+        self.sent = []
+        self.frames = list(frames)
+        self.owner = None
+
+    async def send(self, frame):
+        self.sent.append(frame)
+
+    async def close(self):
+        pass
+
+    async def recv(self, decode=None):
+        assert decode is False
+        if not self.frames:
+            self.owner.should_reconnect = False
+            raise ConnectionClosed(None, None)
+        return self.frames.pop(0)
+
+
+def _connected_client(**kwargs):
+    ws = KalshiWebSocketClient(KalshiClient(api_key="test-key"), **kwargs)
+    ws.websocket = FakeWebSocket()
+    ws.is_connected = True
+    return ws
+
+
+async def test_subscribe_frames_are_compact_json_text():
+    ws = _connected_client()
+
+    assert await ws.subscribe_ticker("MKT-1")
+
+    frame = ws.websocket.sent[0]
+    assert isinstance(frame, str)
+    assert json.loads(frame) == {
+        "id": 1,
+        "cmd": "subscribe",
+        "params": {"market_tickers": ["MKT-1"]},
+    }
+    assert " " not in frame
+    await ws.kalshi_client.close()
+
+
+async def test_subscribe_tickers_batches_frames():
+    ws = _connected_client()
+    tickers = [f"MKT-{i}" for i in range(450)]
+
+    assert await ws.subscribe_tickers(tickers + ["MKT-0"])
+
+    frames = [json.loads(frame) for frame in ws.websocket.sent]
+    assert [len(f["params"]["market_tickers"]) for f in frames] == [200, 200, 50]
+    assert [f["id"] for f in frames] == [1, 2, 3]
+    assert ws.subscribed_tickers == set(tickers)
+    await ws.kalshi_client.close()
+
+
+async def test_resubscribe_all_sends_batched_frames():
+    ws = _connected_client()
+    ws.subscribed_tickers = {f"MKT-{i}" for i in range(250)}
+
+    await ws._resubscribe_all()
+
+    assert len(ws.websocket.sent) == 2
+    await ws.kalshi_client.close()
+
+
+async def test_callbacks_run_on_dispatch_worker():
+    ws = _connected_client()
+    received = []
+
+    async def on_fill(data):
+        received.append(data["ticker"])
+
+    ws.on_fill(on_fill)
+    await ws._process_message({"type": "fill", "data": {"ticker": "MKT-1"}})
+    assert received == []
+
+    ws._ensure_dispatch_worker()
+    await ws._dispatch_queue.join()
+
+    assert received == ["MKT-1"]
+    await ws.disconnect()
+    await ws.kalshi_client.close()
+
+
+async def test_full_dispatch_queue_drops_market_data_instead_of_blocking():
+    ws = _connected_client()
+    ws._dispatch_queue = asyncio.Queue(maxsize=1)
+    ws.on_trade(lambda data: None)
+
+    for i in range(3):
+        await ws._process_message({"type": "trade", "data": {"market_ticker": f"MKT-{i}"}})
+
+    assert ws._dispatch_queue.qsize() == 1
+    assert ws.dropped_messages == 2
+    await ws.kalshi_client.close()
+
+
+async def test_full_dispatch_queue_never_drops_fills():
+    ws = _connected_client()
+    ws._dispatch_queue = asyncio.Queue(maxsize=1)
+    received = []
+    ws.on_fill(lambda data: received.append(data["ticker"]))
+
+    async def read_fills():
+        for i in range(3):
+            await ws._process_message({"type": "fill", "data": {"ticker": f"MKT-{i}"}})
+
+    reader = asyncio.create_task(read_fills())
+    await asyncio.sleep(0)
+    assert not reader.done()
+
+    ws._ensure_dispatch_worker()
+    await reader
+    await ws._dispatch_queue.join()
+
+    assert received == ["MKT-0", "MKT-1", "MKT-2"]
+    assert ws.dropped_messages == 0
+    await ws.disconnect()
+    await ws.kalshi_client.close()
+
+
+async def test_price_aggregator_wraps_history_and_smooths():
+    aggregator = PriceUpdateAggregator()
+    for i in range(150):
+        aggregator.add_price_update("MKT", yes_price=0.50, no_price=0.50)
+    aggregator.add_price_update("MKT", yes_price=0.60, no_price=0.40)
+
+    history = aggregator.price_history["MKT"]
+    assert history.count == PriceUpdateAggregator._HISTORY_SIZE
+    assert aggregator.get_smoothed_price("MKT") == pytest.approx(0.501, abs=1e-3)
+    assert aggregator.get_smoothed_price("OTHER") is None
+
+
+async def test_price_aggregator_detects_rapid_movement_in_window():
+    aggregator = PriceUpdateAggregator(window_seconds=30)
+    aggregator.add_price_update("MKT", yes_price=0.50, no_price=0.50)
+    aggregator.add_price_update("MKT", yes_price=0.51, no_price=0.49)
+    assert not aggregator.detect_rapid_movement("MKT")
+
+    aggregator.add_price_update("MKT", yes_price=0.60, no_price=0.40)
+    assert aggregator.detect_rapid_movement("MKT")
+
+    # Entries older than the window no longer count
+    aggregator.price_history["MKT"].ts[:3] -= 60
+    assert not aggregator.detect_rapid_movement("MKT")
+    assert aggregator.get_smoothed_price("MKT") == pytest.approx(0.60, abs=1e-6)
+
+
+async def test_price_aggregator_reuses_caller_timestamp():
+    aggregator = PriceUpdateAggregator(window_seconds=30)
+    aggregator.add_price_update("MKT", 0.50, 0.50, timestamp=100.0)
+    aggregator.add_price_update("MKT", 0.60, 0.40, timestamp=110.0)
+
+    assert aggregator.detect_rapid_movement("MKT", now=120.0)
+    assert not aggregator.detect_rapid_movement("MKT", now=135.0)
+    assert aggregator.get_smoothed_price("MKT", now=200.0) == pytest.approx(0.60, abs=1e-6)
+
+
+async def test_process_message_records_receive_time():
+    ws = _connected_client()
+
+    await ws._process_message({"type": "ticker", "data": {"ticker": "MKT"}}, received_at=42.0)
+
+    assert ws.last_message_time == 42.0
+    await ws.kalshi_client.close()
+
+
+async def test_listen_parses_raw_byte_frames():
+    ws = _connected_client()
+    ws.websocket = FakeWebSocket([b'{"type":"fill","data":{"ticker":"MKT-1"}}', b"not json"])
+    ws.websocket.owner = ws
+    ws.reconnect_delay = 0
+    received = []
+    ws.on_fill(lambda data: received.append(data["ticker"]))
+
+    await ws.listen()
+    await ws._dispatch_queue.join()
+
+    assert received == ["MKT-1"]
+    assert not ws.is_connected
+    await ws.disconnect()
+    await ws.kalshi_client.close()
+
+
+async def test_ticker_subscribe_template_escapes_tickers():
+    ws = _connected_client()
+
+    assert await ws.subscribe_tickers(['ODD"TICKER', "MKT-2"])
+
+    assert json.loads(ws.websocket.sent[0])["params"]["market_tickers"] == ['ODD"TICKER', "MKT-2"]
+    await ws.kalshi_client.close()
+
+
+async def test_price_window_spans_wrapped_ring():
+    aggregator = PriceUpdateAggregator(window_seconds=30)
+    for i in range(130):
+        aggregator.add_price_update("MKT", 0.50 + (i >= 120) * 0.10, 0.50, timestamp=float(i))
+
+    ring = aggregator.price_history["MKT"]
+    timestamps, prices = ring.window("yes", 60.0)
+    assert timestamps.tolist() == [float(i) for i in range(60, 130)]
+    timestamps, _ = ring.window("yes", 125.0)
+    assert timestamps.tolist() == [125.0, 126.0, 127.0, 128.0, 129.0]
+    assert ring.window("yes", 500.0)[1].size == 0
+    assert aggregator.detect_rapid_movement("MKT", now=130.0)
+    assert not aggregator.detect_rapid_movement("MKT", now=160.0)
+
+
+async def test_ticker_updates_coalesce_to_latest_per_market():
+    ws = _connected_client(ticker_coalesce_window=0.01)
+    received = []
+    ws.on_ticker_update(lambda data: received.append((data["market_ticker"], data["yes_bid"])))
+
+    for price in (40, 41, 42):
+        await ws._process_message(
+            {"type": "ticker", "data": {"market_ticker": "MKT-1", "yes_bid": price}}
+        )
+    await ws._process_message({"type": "ticker", "data": {"market_ticker": "MKT-2", "yes_bid": 10}})
+
+    ws._ensure_dispatch_worker()
+    await ws._ticker_flush
+    await ws._dispatch_queue.join()
+
+    assert received == [("MKT-1", 42), ("MKT-2", 10)]
+    await ws.disconnect()
+    await ws.kalshi_client.close()
+
+
+async def test_callbacks_are_classified_at_registration():
+    ws = _connected_client()
+    calls = []
+
+    async def slow(data):
+        await asyncio.sleep(0.01)
+        calls.append("slow")
+
+    async def failing(data):
+        raise RuntimeError("boom")
+
+    ws.on_fill(slow)
+    ws.on_fill(failing)
+    ws.on_fill(lambda data: calls.append("sync"))
+
+    assert ws.callbacks["fill"]["sync"] and len(ws.callbacks["fill"]["async"]) == 2
+
+    await ws._process_message({"type": "fill", "data": {"ticker": "MKT-1"}})
+    ws._ensure_dispatch_worker()
+    await ws._dispatch_queue.join()
+
+    assert calls == ["sync", "slow"]
+    await ws.disconnect()
+    await ws.kalshi_client.close()
+
+
+async def test_ticker_updates_dispatch_immediately_by_default():
+    ws = _connected_client()
+    ws.on_ticker_update(lambda data: None)
+
+    await ws._process_message({"type": "ticker", "data": {"market_ticker": "MKT-1"}})
+
+    assert ws._ticker_flush is None
+    assert ws._dispatch_queue.qsize() == 1
+    await ws.kalshi_client.close()
+
+
+async def test_disconnect_delivers_pending_ticker_updates():
+    ws = _connected_client(ticker_coalesce_window=60)
+    received = []
+    ws.on_ticker_update(lambda data: received.append(data["market_ticker"]))
+    ws._ensure_dispatch_worker()
+
+    await ws._process_message({"type": "ticker", "data": {"market_ticker": "MKT-1"}})
+    await ws.disconnect()
+
+    assert received == ["MKT-1"]
+    assert ws._ticker_pending == {}
+    await ws.kalshi_client.close()
+
+
+async def test_send_command_marks_unsent_frames():
+    ws = _connected_client()
+
+    async def broken_send(frame):
+        raise ConnectionResetError("socket gone")
+
+    ws.websocket.send = broken_send
+    with pytest.raises(WebSocketSendError):
+        await ws.send_command("cancel_order", {"order_id": "o-1"})
+
+    ws.is_connected = False
+    with pytest.raises(WebSocketSendError):
+        await ws.send_command("cancel_order", {"order_id": "o-1"})
+    await ws.kalshi_client.close()